@@ -13,6 +13,12 @@ from typing import Optional, Dict, List, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
+try:
+    # Optional: batch independent sysfs reads into one submit/reap pair
+    import liburing
+except ImportError:
+    liburing = None
+
 
 class CPUVendor(Enum):
     INTEL = "intel"
@@ -20,6 +26,12 @@ class CPUVendor(Enum):
     UNKNOWN = "unknown"
 
 
+# Intel Core model names have a fixed shape ("... iN-XXXX ..."), so extract
+# the family digit and model number once and dispatch on the leading digit
+# instead of scanning the model string for every generation's substrings.
+_INTEL_CORE_RE = re.compile(r"i([357])-(\d\d?)")
+
+
 class CPUGeneration(Enum):
     # Intel generations
     CORE2 = "core2"           # Core 2 Duo/Quad (2006-2011)
@@ -39,6 +51,34 @@ class CPUGeneration(Enum):
     UNKNOWN = "unknown"
 
 
+# Intel Core generation keyed by the leading model-number digit
+# (i7-2600 -> 2 -> Sandy Bridge). 6th gen and newer fall through to SKYLAKE_PLUS.
+_INTEL_GEN_BY_DIGIT = {
+    2: CPUGeneration.SANDY_BRIDGE,
+    3: CPUGeneration.IVY_BRIDGE,
+    4: CPUGeneration.HASWELL,
+    5: CPUGeneration.BROADWELL,
+}
+
+
+# Maximum safe temperature (Celsius) per (vendor, generation), with
+# per-vendor defaults for generations not listed. Data-driven so new
+# CPUs only need a table entry, not another branch.
+_THERMAL_MAX = {
+    (CPUVendor.INTEL, CPUGeneration.CORE2): 85,          # Core 2 series: ~85°C max
+    (CPUVendor.INTEL, CPUGeneration.NEHALEM): 95,        # Older Core i: ~95°C
+    (CPUVendor.INTEL, CPUGeneration.SANDY_BRIDGE): 95,
+    (CPUVendor.AMD, CPUGeneration.K8): 70,               # Old AMD: lower limits
+    (CPUVendor.AMD, CPUGeneration.K10): 70,
+    (CPUVendor.AMD, CPUGeneration.BULLDOZER): 75,
+}
+
+_THERMAL_VENDOR_DEFAULTS = {
+    CPUVendor.INTEL: 100,  # Modern Intel: ~100°C
+    CPUVendor.AMD: 95,     # Modern AMD Ryzen
+}
+
+
 class GPUVendor(Enum):
     AMD = "amd"
     NVIDIA = "nvidia"
@@ -46,6 +86,121 @@ class GPUVendor(Enum):
     UNKNOWN = "unknown"
 
 
+# PCI vendor IDs as found in /sys/class/drm/card*/device/vendor
+# (compared as lowercased bytes, no per-card list allocation)
+_PCI_VENDOR_IDS = {
+    b"0x1002": GPUVendor.AMD,
+    b"0x10de": GPUVendor.NVIDIA,
+    b"0x8086": GPUVendor.INTEL,
+}
+
+# PCI_ID=VVVV:DDDD line in the DRM device uevent file (read as bytes)
+_PCI_ID_RE = re.compile(rb"PCI_ID=([0-9A-Fa-f:]+)")
+
+# Precompiled bytes patterns applied zero-copy to the /proc/cpuinfo buffer
+_MODEL_NAME_RE = re.compile(rb"model name\s*:\s*(.+)")
+_PROCESSOR_RE = re.compile(rb"^processor\s*:", re.MULTILINE)
+
+
+def _slurp(path, size: int = 128) -> bytes:
+    """Read a small sysfs/proc file as bytes with a single open+read+close.
+
+    Avoids the TextIOWrapper/codec overhead of Path.read_text() for the
+    tiny integer files this module reads; int() accepts the raw bytes.
+    """
+    fd = os.open(str(path), os.O_RDONLY)
+    try:
+        return os.read(fd, size)
+    finally:
+        os.close(fd)
+
+
+def _read_proc_cpuinfo() -> memoryview:
+    """Read all of /proc/cpuinfo into one buffer, exposed as a memoryview.
+
+    On large NUMA hosts the file runs to megabytes; reading into a single
+    growing bytearray and regex-matching the memoryview directly avoids
+    the per-line and per-field string copies of text-mode parsing.
+    """
+    fd = os.open("/proc/cpuinfo", os.O_RDONLY)
+    try:
+        buf = bytearray()
+        chunk = bytearray(1 << 16)
+        while True:
+            n = os.readv(fd, [chunk])
+            if n <= 0:
+                break
+            buf += chunk[:n]
+    finally:
+        os.close(fd)
+    return memoryview(buf)
+
+
+def _slurp_batch_uring(paths: List[str], size: int) -> Dict[str, Optional[bytes]]:
+    """Read many files via io_uring: all reads submitted with one syscall"""
+    results: Dict[str, Optional[bytes]] = {}
+    fds = []
+    try:
+        for path in paths:
+            try:
+                fds.append((path, os.open(path, os.O_RDONLY)))
+            except OSError:
+                results[path] = None
+
+        if fds:
+            ring = liburing.io_uring()
+            liburing.io_uring_queue_init(len(fds), ring, 0)
+            try:
+                pending = {}
+                for i, (path, fd) in enumerate(fds):
+                    buf = bytearray(size)
+                    iov = liburing.iovec(buf)
+                    sqe = liburing.io_uring_get_sqe(ring)
+                    liburing.io_uring_prep_readv(sqe, fd, iov, 0)
+                    sqe.user_data = i
+                    pending[i] = (path, buf, iov)
+
+                liburing.io_uring_submit(ring)
+
+                cqe = liburing.io_uring_cqe()
+                for _ in range(len(fds)):
+                    liburing.io_uring_wait_cqe(ring, cqe)
+                    path, buf, _ = pending[cqe.user_data]
+                    results[path] = bytes(buf[:cqe.res]) if cqe.res >= 0 else None
+                    liburing.io_uring_cqe_seen(ring, cqe)
+            finally:
+                liburing.io_uring_queue_exit(ring)
+    finally:
+        for _, fd in fds:
+            os.close(fd)
+
+    return results
+
+
+def _slurp_batch(paths, size: int = 128) -> Dict[str, Optional[bytes]]:
+    """Read a batch of small files, returning {path: bytes or None}.
+
+    Uses io_uring (one submit + one reap for the whole batch) when the
+    optional liburing bindings are available, otherwise falls back to a
+    sequential _slurp() loop. Unreadable files map to None.
+    """
+    paths = [str(p) for p in paths]
+
+    if liburing is not None:
+        try:
+            return _slurp_batch_uring(paths, size)
+        except Exception:
+            pass  # Old kernel or uring setup failure - use the portable path
+
+    results: Dict[str, Optional[bytes]] = {}
+    for path in paths:
+        try:
+            results[path] = _slurp(path, size)
+        except OSError:
+            results[path] = None
+    return results
+
+
 @dataclass
 class CPUInfo:
     vendor: CPUVendor
@@ -91,15 +246,14 @@ class HardwareDetector:
         generation = CPUGeneration.UNKNOWN
         cores = 1
 
-        # Read /proc/cpuinfo
+        # Read /proc/cpuinfo once and parse it in place
         try:
-            with open("/proc/cpuinfo", "r") as f:
-                cpuinfo = f.read()
+            cpuinfo = _read_proc_cpuinfo()
 
-            # Extract model name
-            model_match = re.search(r"model name\s*:\s*(.+)", cpuinfo)
+            # Extract model name (decode only the one field we keep as str)
+            model_match = _MODEL_NAME_RE.search(cpuinfo)
             if model_match:
-                model_name = model_match.group(1).strip()
+                model_name = model_match.group(1).decode().strip()
 
             # Detect vendor
             if "Intel" in model_name:
@@ -108,7 +262,7 @@ class HardwareDetector:
                 vendor = CPUVendor.AMD
 
             # Count cores
-            cores = len(re.findall(r"^processor\s*:", cpuinfo, re.MULTILINE))
+            cores = sum(1 for _ in _PROCESSOR_RE.finditer(cpuinfo))
 
             # Detect generation
             generation = self._detect_cpu_generation(vendor, model_name)
@@ -123,8 +277,8 @@ class HardwareDetector:
         # Detect MSR support
         supports_msr = self._check_msr_support()
 
-        # Detect cpufreq support
-        supports_cpufreq = Path("/sys/devices/system/cpu/cpu0/cpufreq").exists()
+        # Detect cpufreq support (existence only - no Path machinery needed)
+        supports_cpufreq = os.access("/sys/devices/system/cpu/cpu0/cpufreq", os.F_OK)
 
         # Determine safe thermal max
         thermal_max = self._get_thermal_max_safe(vendor, generation)
@@ -148,17 +302,12 @@ class HardwareDetector:
             # Core 2 series
             if re.search(r"Core\(TM\)2|Pentium\(R\) Dual", model_name):
                 return CPUGeneration.CORE2
-            # Core i-series by generation
-            elif "i3-2" in model_name or "i5-2" in model_name or "i7-2" in model_name:
-                return CPUGeneration.SANDY_BRIDGE
-            elif "i3-3" in model_name or "i5-3" in model_name or "i7-3" in model_name:
-                return CPUGeneration.IVY_BRIDGE
-            elif "i3-4" in model_name or "i5-4" in model_name or "i7-4" in model_name:
-                return CPUGeneration.HASWELL
-            elif "i3-5" in model_name or "i5-5" in model_name or "i7-5" in model_name:
-                return CPUGeneration.BROADWELL
-            elif re.search(r"i[357]-[6-9]|i[357]-1[0-9]", model_name):
-                return CPUGeneration.SKYLAKE_PLUS
+            # Core i-series by generation (single parse + table dispatch)
+            match = _INTEL_CORE_RE.search(model_name)
+            if match:
+                digits = match.group(2)
+                first_digit = int(digits[0]) if len(digits) == 2 else int(digits)
+                return _INTEL_GEN_BY_DIGIT.get(first_digit, CPUGeneration.SKYLAKE_PLUS)
             elif "i3" in model_name or "i5" in model_name or "i7" in model_name:
                 return CPUGeneration.NEHALEM
 
@@ -179,15 +328,11 @@ class HardwareDetector:
         min_freq = 800  # Conservative default
         max_freq = 3000
 
-        # Try cpufreq first
+        # Try cpufreq first (read directly; missing files just raise)
         try:
-            cpuinfo_min = Path("/sys/devices/system/cpu/cpu0/cpufreq/cpuinfo_min_freq")
-            cpuinfo_max = Path("/sys/devices/system/cpu/cpu0/cpufreq/cpuinfo_max_freq")
-
-            if cpuinfo_min.exists() and cpuinfo_max.exists():
-                min_freq = int(cpuinfo_min.read_text().strip()) // 1000
-                max_freq = int(cpuinfo_max.read_text().strip()) // 1000
-                return min_freq, max_freq
+            min_freq = int(_slurp("/sys/devices/system/cpu/cpu0/cpufreq/cpuinfo_min_freq")) // 1000
+            max_freq = int(_slurp("/sys/devices/system/cpu/cpu0/cpufreq/cpuinfo_max_freq")) // 1000
+            return min_freq, max_freq
         except Exception:
             pass
 
@@ -228,25 +373,11 @@ class HardwareDetector:
 
     def _get_thermal_max_safe(self, vendor: CPUVendor, generation: CPUGeneration) -> int:
         """Get maximum safe temperature for CPU"""
-        # Intel thermal limits
-        if vendor == CPUVendor.INTEL:
-            if generation == CPUGeneration.CORE2:
-                return 85  # Core 2 series: ~85°C max
-            elif generation in [CPUGeneration.NEHALEM, CPUGeneration.SANDY_BRIDGE]:
-                return 95  # Older Core i: ~95°C
-            else:
-                return 100  # Modern Intel: ~100°C
-
-        # AMD thermal limits
-        elif vendor == CPUVendor.AMD:
-            if generation in [CPUGeneration.K8, CPUGeneration.K10]:
-                return 70  # Old AMD: lower limits
-            elif generation == CPUGeneration.BULLDOZER:
-                return 75
-            else:
-                return 95  # Modern AMD Ryzen
-
-        return 85  # Conservative default
+        # 85°C is the conservative default for unknown vendors
+        return _THERMAL_MAX.get(
+            (vendor, generation),
+            _THERMAL_VENDOR_DEFAULTS.get(vendor, 85)
+        )
 
     def _detect_gpu(self) -> GPUInfo:
         """Detect GPU information"""
@@ -271,29 +402,20 @@ class HardwareDetector:
                 # Try to identify vendor
                 vendor_id = None
                 try:
-                    vendor_file = device_dir / "vendor"
-                    if vendor_file.exists():
-                        vendor_id = vendor_file.read_text().strip()
-                except Exception:
+                    vendor_id = _slurp(device_dir / "vendor").strip().lower()
+                except OSError:
                     pass
 
                 # Determine vendor from ID
                 if vendor_id:
-                    if vendor_id == "0x1002":
-                        vendor = GPUVendor.AMD
-                    elif vendor_id in ["0x10de", "0x10DE"]:
-                        vendor = GPUVendor.NVIDIA
-                    elif vendor_id == "0x8086":
-                        vendor = GPUVendor.INTEL
+                    vendor = _PCI_VENDOR_IDS.get(vendor_id, vendor)
 
                 # Try to get model name
                 try:
-                    uevent_file = device_dir / "uevent"
-                    if uevent_file.exists():
-                        uevent = uevent_file.read_text()
-                        pci_id_match = re.search(r"PCI_ID=([0-9A-Fa-f:]+)", uevent)
-                        if pci_id_match:
-                            model_name = f"GPU {pci_id_match.group(1)}"
+                    uevent = _slurp(device_dir / "uevent", 4096)
+                    pci_id_match = _PCI_ID_RE.search(uevent)
+                    if pci_id_match:
+                        model_name = f"GPU {pci_id_match.group(1).decode()}"
                 except Exception:
                     pass
 
@@ -350,21 +472,24 @@ class HardwareDetector:
         zones = []
         current_temp = None
 
-        # Find all thermal zones
+        # Find all thermal zones and read their temperatures in one batch
         thermal_base = Path("/sys/class/thermal")
         if thermal_base.exists():
-            for zone in thermal_base.glob("thermal_zone*"):
-                temp_file = zone / "temp"
-                if temp_file.exists():
-                    zones.append(str(temp_file))
-
-                    # Read temperature from first zone
-                    if current_temp is None:
-                        try:
-                            temp_millidegrees = int(temp_file.read_text().strip())
-                            current_temp = temp_millidegrees // 1000
-                        except Exception:
-                            pass
+            temp_files = [str(zone / "temp") for zone in thermal_base.glob("thermal_zone*")]
+            contents = _slurp_batch(temp_files)
+
+            for temp_file in temp_files:
+                data = contents.get(temp_file)
+                if data is None:
+                    continue
+                zones.append(temp_file)
+
+                # Use the temperature from the first readable zone
+                if current_temp is None:
+                    try:
+                        current_temp = int(data) // 1000
+                    except ValueError:
+                        pass
 
         # Use CPU thermal max as system thermal max
         max_safe_temp = self.cpu_info.thermal_max_safe
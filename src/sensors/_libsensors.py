@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+ctypes client for libsensors
+Talks to libsensors.so directly instead of forking the sensors(1)
+binary: the library initializes once per process and each poll is a
+handful of in-process calls rather than fork+exec+ELF-load (~30-80ms)
+"""
+
+import ctypes
+import ctypes.util
+from typing import Iterator, Optional, Tuple
+
+try:
+    _lib = ctypes.CDLL("libsensors.so.5")
+except OSError:
+    _name = ctypes.util.find_library("sensors")
+    _lib = ctypes.CDLL(_name) if _name else None
+
+
+# Feature types from sensors.h (sensors_feature_type)
+FEATURE_IN = 0
+FEATURE_FAN = 1
+FEATURE_TEMP = 2
+FEATURE_POWER = 3
+FEATURE_ENERGY = 4
+FEATURE_CURR = 5
+FEATURE_HUMIDITY = 6
+
+# sensors_subfeature.flags bit: subfeature is readable
+_MODE_R = 1
+
+
+class _BusId(ctypes.Structure):
+    _fields_ = [("type", ctypes.c_short), ("nr", ctypes.c_short)]
+
+
+class _ChipName(ctypes.Structure):
+    _fields_ = [
+        ("prefix", ctypes.c_char_p),
+        ("bus", _BusId),
+        ("addr", ctypes.c_int),
+        ("path", ctypes.c_char_p),
+    ]
+
+
+class _Feature(ctypes.Structure):
+    _fields_ = [
+        ("name", ctypes.c_char_p),
+        ("number", ctypes.c_int),
+        ("type", ctypes.c_int),
+        ("first_subfeature", ctypes.c_int),
+        ("padding1", ctypes.c_int),
+    ]
+
+
+class _Subfeature(ctypes.Structure):
+    _fields_ = [
+        ("name", ctypes.c_char_p),
+        ("number", ctypes.c_int),
+        ("type", ctypes.c_int),
+        ("mapping", ctypes.c_int),
+        ("flags", ctypes.c_uint),
+    ]
+
+
+if _lib is not None:
+    _lib.sensors_init.argtypes = [ctypes.c_void_p]
+    _lib.sensors_init.restype = ctypes.c_int
+    _lib.sensors_get_detected_chips.argtypes = [
+        ctypes.POINTER(_ChipName), ctypes.POINTER(ctypes.c_int)]
+    _lib.sensors_get_detected_chips.restype = ctypes.POINTER(_ChipName)
+    _lib.sensors_snprintf_chip_name.argtypes = [
+        ctypes.c_char_p, ctypes.c_size_t, ctypes.POINTER(_ChipName)]
+    _lib.sensors_snprintf_chip_name.restype = ctypes.c_int
+    _lib.sensors_get_features.argtypes = [
+        ctypes.POINTER(_ChipName), ctypes.POINTER(ctypes.c_int)]
+    _lib.sensors_get_features.restype = ctypes.POINTER(_Feature)
+    _lib.sensors_get_all_subfeatures.argtypes = [
+        ctypes.POINTER(_ChipName), ctypes.POINTER(_Feature),
+        ctypes.POINTER(ctypes.c_int)]
+    _lib.sensors_get_all_subfeatures.restype = ctypes.POINTER(_Subfeature)
+    _lib.sensors_get_label.argtypes = [
+        ctypes.POINTER(_ChipName), ctypes.POINTER(_Feature)]
+    _lib.sensors_get_label.restype = ctypes.c_void_p  # char* we must free
+    _lib.sensors_get_value.argtypes = [
+        ctypes.POINTER(_ChipName), ctypes.c_int,
+        ctypes.POINTER(ctypes.c_double)]
+    _lib.sensors_get_value.restype = ctypes.c_int
+
+    _libc = ctypes.CDLL(None)
+    _libc.free.argtypes = [ctypes.c_void_p]
+    _libc.free.restype = None
+
+
+_initialized = False
+
+
+def available() -> bool:
+    """Whether libsensors loaded and initialized in this process"""
+    global _initialized
+    if _lib is None:
+        return False
+    if not _initialized:
+        # NULL config file = library defaults (same as sensors(1))
+        if _lib.sensors_init(None) != 0:
+            return False
+        _initialized = True
+    return True
+
+
+def _chip_name(chip) -> str:
+    buf = ctypes.create_string_buffer(256)
+    if _lib.sensors_snprintf_chip_name(buf, len(buf), chip) < 0:
+        return (chip.contents.prefix or b"unknown").decode(errors="replace")
+    return buf.value.decode(errors="replace")
+
+
+def _feature_label(chip, feature) -> str:
+    ptr = _lib.sensors_get_label(chip, feature)
+    if not ptr:
+        return (feature.contents.name or b"").decode(errors="replace")
+    try:
+        return ctypes.cast(ptr, ctypes.c_char_p).value.decode(errors="replace")
+    finally:
+        _libc.free(ptr)
+
+
+def _feature_value(chip, feature) -> Optional[float]:
+    """Read the primary (input/average) subfeature of a feature"""
+    nr = ctypes.c_int(0)
+    while True:
+        sub = _lib.sensors_get_all_subfeatures(chip, feature, ctypes.byref(nr))
+        if not sub:
+            return None
+        if not (sub.contents.flags & _MODE_R):
+            continue
+        name = (sub.contents.name or b"").decode(errors="replace")
+        if not (name.endswith("_input") or name.endswith("_average")):
+            continue
+        value = ctypes.c_double()
+        if _lib.sensors_get_value(chip, sub.contents.number,
+                                  ctypes.byref(value)) != 0:
+            return None
+        return value.value
+
+
+def iter_readings() -> Iterator[Tuple[str, str, int, float]]:
+    """Yield (chip, label, feature type, value) for every detected reading.
+
+    Values come back already scaled to natural units (degrees, RPM,
+    volts...), same as sensors(1) prints them. Feature type is one of
+    the FEATURE_* constants above.
+    """
+    if not available():
+        return
+
+    chip_nr = ctypes.c_int(0)
+    while True:
+        chip = _lib.sensors_get_detected_chips(None, ctypes.byref(chip_nr))
+        if not chip:
+            break
+
+        name = _chip_name(chip)
+        feat_nr = ctypes.c_int(0)
+        while True:
+            feature = _lib.sensors_get_features(chip, ctypes.byref(feat_nr))
+            if not feature:
+                break
+            value = _feature_value(chip, feature)
+            if value is None:
+                continue
+            yield (name, _feature_label(chip, feature),
+                   feature.contents.type, value)
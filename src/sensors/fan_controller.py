@@ -7,12 +7,50 @@ Works on atypical systems including all-in-one PCs
 """
 
 import os
+import re
 import subprocess
+import time
 from pathlib import Path
 from typing import List, Optional, Dict
 from dataclasses import dataclass
 from enum import Enum
 
+try:
+    from sensors.sysfs_io import SysfsReader
+except ImportError:
+    from sysfs_io import SysfsReader
+
+
+# nvidia-smi/nvidia-settings can hang on unhealthy drivers; the ceiling is
+# tunable and a timeout disables NVIDIA fan control for the process lifetime
+NVIDIA_SMI_TIMEOUT = float(os.environ.get("PM_NVIDIA_SMI_TIMEOUT", "60"))
+
+
+def _nvidia_driver_present() -> bool:
+    """Check whether the NVIDIA kernel driver is actually loaded"""
+    return os.path.exists("/proc/driver/nvidia/version") or os.path.exists("/dev/nvidiactl")
+
+
+# PWM (0-255) to percent, precomputed so per-fan conversion is a table
+# lookup with no floating-point division
+_PWM_TO_PCT = tuple(v * 100 // 255 for v in range(256))
+
+
+# Reading disk-backed sensors (drivetemp, NVMe, SATA) can wake idle
+# drives, so they get a much longer default poll interval than fans
+_SLOW_POLL_CHIP_RE = re.compile(r"drivetemp|nvme|sd[a-z]")
+_DEFAULT_POLL_MS = 1000
+_DISK_POLL_MS = 60000
+
+
+def _read_sysfs(path: str, size: int = 64) -> bytes:
+    """Read a small sysfs attribute with a single open/read/close"""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return os.read(fd, size)
+    finally:
+        os.close(fd)
+
 
 class FanControlMode(Enum):
     AUTO = "auto"
@@ -41,66 +79,91 @@ class UniversalFanController:
     """
 
     def __init__(self):
-        self.pwm_fans = self._detect_pwm_fans()
-        self.gpu_fans = self._detect_gpu_fans()
-
-    def _detect_pwm_fans(self) -> List[Dict]:
-        """Detect all PWM-controllable fans"""
+        self._sysfs = SysfsReader()
+        self._nvidia_disabled = False
+        self._pwm_fans: Optional[List[Dict]] = None
+        self._gpu_fans: Optional[List[Dict]] = None
+
+    @property
+    def pwm_fans(self) -> List[Dict]:
+        """PWM fans; enumeration runs lazily on first access"""
+        if self._pwm_fans is None:
+            self._pwm_fans = self._enumerate_pwm_fans()
+            self._refresh_pwm_fans()
+        return self._pwm_fans
+
+    @property
+    def gpu_fans(self) -> List[Dict]:
+        """GPU fans; detection runs lazily on first access"""
+        if self._gpu_fans is None:
+            self._gpu_fans = self._detect_gpu_fans()
+        return self._gpu_fans
+
+    def _mark_nvidia_disabled(self, reason: str):
+        """Stop probing NVIDIA for the rest of the process (log once)"""
+        if not self._nvidia_disabled:
+            self._nvidia_disabled = True
+            print(f"⚠️  NVIDIA fan control disabled: {reason}")
+
+    def close(self):
+        """Release cached sysfs descriptors"""
+        self._sysfs.close()
+
+    def __del__(self):
+        self.close()
+
+    def _enumerate_pwm_fans(self) -> List[Dict]:
+        """Enumerate PWM-controllable fans (paths only, no live values).
+
+        Runs once; the scandir/stat cost of walking hwmon never has to be
+        paid again. _refresh_pwm_fans fills in the live readings.
+        """
         fans = []
-        hwmon_base = Path("/sys/class/hwmon")
 
-        if not hwmon_base.exists():
+        try:
+            hwmon_dirs = [entry.path for entry in os.scandir("/sys/class/hwmon")
+                          if entry.name.startswith("hwmon")]
+        except FileNotFoundError:
             return fans
 
-        for hwmon_dir in hwmon_base.glob("hwmon*"):
-            chip_name = "unknown"
+        for hwmon_path in sorted(hwmon_dirs):
+            # One scandir pass lists every attribute the chip exposes;
+            # later lookups are set membership instead of stat() probes
+            try:
+                attrs = {entry.name for entry in os.scandir(hwmon_path)}
+            except OSError:
+                continue
 
-            # Get chip name
-            name_file = hwmon_dir / "name"
-            if name_file.exists():
-                chip_name = name_file.read_text().strip()
+            chip_name = "unknown"
+            if "name" in attrs:
+                try:
+                    chip_name = _read_sysfs(os.path.join(hwmon_path, "name")).decode().strip()
+                except OSError:
+                    pass
 
             # Find PWM controls
-            for pwm_file in hwmon_dir.glob("pwm[0-9]"):
+            for attr in sorted(attrs):
+                if not (attr.startswith("pwm") and attr[3:].isdigit()):
+                    continue
+
                 try:
-                    pwm_num = pwm_file.name.replace("pwm", "")
-
-                    # Get PWM enable path (for switching modes)
-                    pwm_enable_file = hwmon_dir / f"pwm{pwm_num}_enable"
-
-                    # Get fan input (RPM) if available
-                    fan_input_file = hwmon_dir / f"fan{pwm_num}_input"
-
-                    # Get current PWM value
-                    current_pwm = int(pwm_file.read_text().strip())
-
-                    # Get current RPM if available
-                    current_rpm = None
-                    if fan_input_file.exists():
-                        try:
-                            current_rpm = int(fan_input_file.read_text().strip())
-                        except Exception:
-                            pass
-
-                    # Get current mode
-                    mode = FanControlMode.AUTO
-                    if pwm_enable_file.exists():
-                        try:
-                            enable_value = int(pwm_enable_file.read_text().strip())
-                            # 0 = full speed, 1 = manual, 2 = auto, 3+ = varies by driver
-                            mode = FanControlMode.MANUAL if enable_value == 1 else FanControlMode.AUTO
-                        except Exception:
-                            pass
+                    pwm_num = attr[3:]
+
+                    # Companion attributes (mode switching, RPM readback)
+                    enable_name = f"pwm{pwm_num}_enable"
+                    fan_input_name = f"fan{pwm_num}_input"
 
                     fans.append({
                         'name': f"{chip_name}/pwm{pwm_num}",
                         'chip': chip_name,
-                        'pwm_path': str(pwm_file),
-                        'pwm_enable_path': str(pwm_enable_file) if pwm_enable_file.exists() else None,
-                        'fan_input_path': str(fan_input_file) if fan_input_file.exists() else None,
-                        'current_pwm': current_pwm,
-                        'current_rpm': current_rpm,
-                        'mode': mode
+                        'pwm_path': os.path.join(hwmon_path, attr),
+                        'pwm_enable_path': os.path.join(hwmon_path, enable_name) if enable_name in attrs else None,
+                        'fan_input_path': os.path.join(hwmon_path, fan_input_name) if fan_input_name in attrs else None,
+                        'current_pwm': None,
+                        'current_rpm': None,
+                        'mode': FanControlMode.AUTO,
+                        'min_interval_ms': _DISK_POLL_MS if _SLOW_POLL_CHIP_RE.search(chip_name) else _DEFAULT_POLL_MS,
+                        'last_read_ns': 0
                     })
 
                 except Exception as e:
@@ -108,59 +171,104 @@ class UniversalFanController:
 
         return fans
 
+    def _refresh_pwm_fans(self):
+        """Re-read live PWM/RPM/mode values for every enumerated fan.
+
+        Only cheap pread()s on cached descriptors happen here; callers
+        can refresh at poll rate without re-walking hwmon. Fans whose
+        min_interval_ms hasn't elapsed keep their last values, so slow
+        consumers (e.g. disk-adjacent chips) aren't woken needlessly.
+        """
+        now = time.monotonic_ns()
+        for fan in self.pwm_fans:
+            if now - fan['last_read_ns'] < fan['min_interval_ms'] * 1_000_000:
+                continue
+            fan['last_read_ns'] = now
+
+            try:
+                fan['current_pwm'] = int(self._sysfs.read(fan['pwm_path']))
+            except (OSError, ValueError):
+                fan['current_pwm'] = None
+
+            if fan['fan_input_path']:
+                try:
+                    fan['current_rpm'] = int(self._sysfs.read(fan['fan_input_path']))
+                except (OSError, ValueError):
+                    fan['current_rpm'] = None
+
+            if fan['pwm_enable_path']:
+                try:
+                    enable_value = int(self._sysfs.read(fan['pwm_enable_path']))
+                    # 0 = full speed, 1 = manual, 2 = auto, 3+ = varies by driver
+                    fan['mode'] = FanControlMode.MANUAL if enable_value == 1 else FanControlMode.AUTO
+                except (OSError, ValueError):
+                    pass
+
+    def set_poll_interval(self, fan_name: str, ms: int) -> bool:
+        """Override the minimum poll interval for one fan (by name)"""
+        for fan in self.pwm_fans:
+            if fan['name'] == fan_name:
+                fan['min_interval_ms'] = ms
+                return True
+        return False
+
     def _detect_gpu_fans(self) -> List[Dict]:
         """Detect GPU fans"""
         gpu_fans = []
 
-        # NVIDIA GPUs
-        try:
-            result = subprocess.run(
-                ["nvidia-smi", "--query-gpu=index,name", "--format=csv,noheader"],
-                capture_output=True,
-                text=True,
-                timeout=3
-            )
-
-            if result.returncode == 0:
-                for line in result.stdout.strip().split('\n'):
-                    if line:
-                        parts = [p.strip() for p in line.split(',')]
-                        gpu_index = int(parts[0])
-                        gpu_name = parts[1] if len(parts) > 1 else f"GPU {gpu_index}"
-
-                        gpu_fans.append({
-                            'type': 'nvidia',
-                            'index': gpu_index,
-                            'name': f"{gpu_name} Fan"
-                        })
-        except (FileNotFoundError, subprocess.TimeoutExpired, Exception):
-            pass
+        # NVIDIA GPUs (only when the kernel driver is actually loaded)
+        if not self._nvidia_disabled and _nvidia_driver_present():
+            try:
+                result = subprocess.run(
+                    ["nvidia-smi", "--query-gpu=index,name", "--format=csv,noheader"],
+                    capture_output=True,
+                    text=True,
+                    timeout=NVIDIA_SMI_TIMEOUT
+                )
+
+                if result.returncode == 0:
+                    for line in result.stdout.strip().split('\n'):
+                        if line:
+                            parts = [p.strip() for p in line.split(',')]
+                            gpu_index = int(parts[0])
+                            gpu_name = parts[1] if len(parts) > 1 else f"GPU {gpu_index}"
+
+                            gpu_fans.append({
+                                'type': 'nvidia',
+                                'index': gpu_index,
+                                'name': f"{gpu_name} Fan"
+                            })
+            except subprocess.TimeoutExpired:
+                self._mark_nvidia_disabled(f"nvidia-smi detection exceeded {NVIDIA_SMI_TIMEOUT}s")
+            except (FileNotFoundError, Exception):
+                pass
 
         # AMD GPUs (via sysfs)
-        drm_path = Path("/sys/class/drm")
-        if drm_path.exists():
-            for card_dir in sorted(drm_path.glob("card[0-9]*")):
-                if "-" in card_dir.name:
-                    continue
-
-                device_dir = card_dir / "device"
-                vendor_file = device_dir / "vendor"
-
-                if vendor_file.exists():
-                    vendor_id = vendor_file.read_text().strip()
-                    if vendor_id == "0x1002":  # AMD
-                        # Check if PWM control exists
-                        hwmon_dir = device_dir / "hwmon"
-                        if hwmon_dir.exists():
-                            for hwmon_subdir in hwmon_dir.glob("hwmon*"):
-                                pwm_files = list(hwmon_subdir.glob("pwm[0-9]"))
-                                if pwm_files:
-                                    gpu_fans.append({
-                                        'type': 'amd',
-                                        'name': f"AMD GPU {card_dir.name} Fan",
-                                        'card_path': str(card_dir),
-                                        'pwm_path': str(pwm_files[0])
-                                    })
+        for card_dir in sorted(Path("/sys/class/drm").glob("card[0-9]*")):
+            if "-" in card_dir.name:
+                continue
+
+            device_dir = card_dir / "device"
+
+            # EAFP: just read the vendor file; a missing one means no PCI device
+            try:
+                vendor_id = (device_dir / "vendor").read_bytes().strip()
+            except OSError:
+                continue
+
+            if vendor_id != b"0x1002":  # AMD
+                continue
+
+            # Check if PWM control exists (glob on a missing dir yields nothing)
+            for hwmon_subdir in (device_dir / "hwmon").glob("hwmon*"):
+                pwm_files = list(hwmon_subdir.glob("pwm[0-9]"))
+                if pwm_files:
+                    gpu_fans.append({
+                        'type': 'amd',
+                        'name': f"AMD GPU {card_dir.name} Fan",
+                        'card_path': str(card_dir),
+                        'pwm_path': str(pwm_files[0])
+                    })
 
         return gpu_fans
 
@@ -169,13 +277,14 @@ class UniversalFanController:
         if fan_index >= len(self.pwm_fans):
             return None
 
+        self._refresh_pwm_fans()
         fan = self.pwm_fans[fan_index]
 
         return FanInfo(
             name=fan['name'],
             current_speed=fan['current_rpm'],
             current_pwm=fan['current_pwm'],
-            current_percent=int((fan['current_pwm'] / 255) * 100) if fan['current_pwm'] else None,
+            current_percent=_PWM_TO_PCT[fan['current_pwm']] if fan['current_pwm'] else None,
             pwm_path=fan['pwm_path'],
             pwm_enable_path=fan['pwm_enable_path'],
             mode=fan['mode']
@@ -208,15 +317,14 @@ class UniversalFanController:
             # First, set to manual mode if possible
             if fan['pwm_enable_path']:
                 try:
-                    with open(fan['pwm_enable_path'], 'w') as f:
-                        f.write('1')  # 1 = manual mode
+                    self._sysfs.write(fan['pwm_enable_path'], b'1')  # 1 = manual mode
                 except PermissionError:
                     print(f"Permission denied. Try running with sudo.")
                     return False
 
-            # Set PWM value
-            with open(fan['pwm_path'], 'w') as f:
-                f.write(str(pwm_value))
+            # Set PWM value over the cached write fd - a single write()
+            # syscall per step, which matters in ramp/PID loops
+            self._sysfs.write(fan['pwm_path'], str(pwm_value).encode())
 
             print(f"✅ Set {fan['name']} to {percent}% (PWM {pwm_value})")
             return True
@@ -240,8 +348,7 @@ class UniversalFanController:
             return False
 
         try:
-            with open(fan['pwm_enable_path'], 'w') as f:
-                f.write('2')  # 2 = automatic mode
+            self._sysfs.write(fan['pwm_enable_path'], b'2')  # 2 = automatic mode
 
             print(f"✅ Set {fan['name']} to automatic mode")
             return True
@@ -264,18 +371,21 @@ class UniversalFanController:
         Returns:
             True if successful
         """
+        if self._nvidia_disabled or not _nvidia_driver_present():
+            return False
+
         try:
             # Enable manual fan control
             subprocess.run([
                 "nvidia-settings",
                 "-a", f"[gpu:{gpu_index}]/GPUFanControlState=1"
-            ], check=True, capture_output=True, timeout=5)
+            ], check=True, capture_output=True, timeout=NVIDIA_SMI_TIMEOUT)
 
             # Set fan speed
             subprocess.run([
                 "nvidia-settings",
                 "-a", f"[fan:{gpu_index}]/GPUTargetFanSpeed={percent}"
-            ], check=True, capture_output=True, timeout=5)
+            ], check=True, capture_output=True, timeout=NVIDIA_SMI_TIMEOUT)
 
             print(f"✅ NVIDIA GPU {gpu_index} fan set to {percent}%")
             return True
@@ -283,6 +393,9 @@ class UniversalFanController:
         except FileNotFoundError:
             print("❌ nvidia-settings not found. Install it to control NVIDIA GPU fans.")
             return False
+        except subprocess.TimeoutExpired:
+            self._mark_nvidia_disabled(f"nvidia-settings exceeded {NVIDIA_SMI_TIMEOUT}s")
+            return False
         except subprocess.CalledProcessError as e:
             print(f"❌ Failed to set NVIDIA GPU fan: {e}")
             return False
@@ -292,15 +405,21 @@ class UniversalFanController:
 
     def set_nvidia_gpu_fan_auto(self, gpu_index: int) -> bool:
         """Set NVIDIA GPU fan to automatic mode"""
+        if self._nvidia_disabled or not _nvidia_driver_present():
+            return False
+
         try:
             subprocess.run([
                 "nvidia-settings",
                 "-a", f"[gpu:{gpu_index}]/GPUFanControlState=0"
-            ], check=True, capture_output=True, timeout=5)
+            ], check=True, capture_output=True, timeout=NVIDIA_SMI_TIMEOUT)
 
             print(f"✅ NVIDIA GPU {gpu_index} fan set to automatic")
             return True
 
+        except subprocess.TimeoutExpired:
+            self._mark_nvidia_disabled(f"nvidia-settings exceeded {NVIDIA_SMI_TIMEOUT}s")
+            return False
         except Exception as e:
             print(f"❌ Error: {e}")
             return False
@@ -314,12 +433,13 @@ class UniversalFanController:
         lines.append("")
 
         # PWM Fans
+        self._refresh_pwm_fans()
         if self.pwm_fans:
             lines.append(f"🌀 PWM Fans: {len(self.pwm_fans)}")
             lines.append("-" * 70)
 
             for i, fan in enumerate(self.pwm_fans):
-                current_percent = int((fan['current_pwm'] / 255) * 100) if fan['current_pwm'] else 0
+                current_percent = _PWM_TO_PCT[fan['current_pwm']] if fan['current_pwm'] else 0
                 mode_str = fan['mode'].value
 
                 rpm_str = f"{fan['current_rpm']} RPM" if fan['current_rpm'] else "N/A"
@@ -6,14 +6,28 @@ Supports: NVIDIA (nvidia-smi), AMD (sysfs), Intel (sysfs)
 Works on atypical systems and all-in-one PCs
 """
 
+import asyncio
 import os
-import re
 import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from threading import Thread
 from typing import Optional, List, Dict
 from dataclasses import dataclass
 from enum import Enum
 
+try:
+    from sensors.sysfs_io import SysfsReader
+except ImportError:
+    from sysfs_io import SysfsReader
+
+try:
+    # Optional: query the NVIDIA driver in-process instead of forking nvidia-smi
+    import pynvml
+except ImportError:
+    pynvml = None
+
 
 class GPUVendor(Enum):
     NVIDIA = "nvidia"
@@ -22,6 +36,51 @@ class GPUVendor(Enum):
     UNKNOWN = "unknown"
 
 
+# Metric columns requested from nvidia-smi (one-shot and loop mode)
+_NVIDIA_QUERY = "temperature.gpu,fan.speed,power.draw,power.limit,utilization.gpu,memory.used,memory.total"
+
+# nvidia-smi can hang for a long time on unhealthy drivers or big multi-GPU
+# boxes; the ceiling is tunable and a timeout disables NVIDIA probing for
+# the rest of the process so callers aren't blocked again
+NVIDIA_SMI_TIMEOUT = float(os.environ.get("PM_NVIDIA_SMI_TIMEOUT", "60"))
+
+
+# PWM (0-255) to percent, precomputed so per-sample conversion is a
+# table lookup with no floating-point division
+_PWM_TO_PCT = tuple(v * 100 // 255 for v in range(256))
+
+
+def _csv_int(token: bytes) -> Optional[int]:
+    """Parse one nounits CSV column from nvidia-smi; 'N/A' becomes None"""
+    token = token.strip()
+    if not token or token in (b'N/A', b'[N/A]'):
+        return None
+    try:
+        return int(token)
+    except ValueError:
+        # Power columns carry a decimal point even with nounits
+        return int(float(token))
+
+
+def _nvidia_driver_present() -> bool:
+    """Check whether the NVIDIA kernel driver is actually loaded.
+
+    With the nvidia-smi binary installed but no driver loaded, the tool
+    can take ~10 s to fail; these kernel nodes are authoritative and
+    cost one stat each.
+    """
+    return os.path.exists("/proc/driver/nvidia/version") or os.path.exists("/dev/nvidiactl")
+
+# Per-vendor metric cache TTL: the hardware only refreshes its sensor
+# values every so often (NVIDIA power updates each ~20-100 ms), so
+# re-querying faster than that just re-reads the same value
+_CACHE_TTL_NS = {
+    GPUVendor.NVIDIA: 100_000_000,  # 100 ms
+    GPUVendor.AMD: 50_000_000,      # 50 ms
+    GPUVendor.INTEL: 50_000_000,
+}
+
+
 @dataclass
 class GPUMetrics:
     """GPU metrics data"""
@@ -44,38 +103,137 @@ class UniversalGPUMonitor:
     Handles atypical systems, all-in-one PCs, multiple GPUs
     """
 
-    def __init__(self):
-        self.gpus = self._detect_all_gpus()
-        self.primary_gpu = self.gpus[0] if self.gpus else None
+    def __init__(self, detect_vendors=("nvidia", "amd", "intel")):
+        """
+        Args:
+            detect_vendors: Which vendor probes to run. Callers that know
+                the machine has no NVIDIA GPU can pass ("amd", "intel")
+                to avoid the nvidia-smi/NVML probe entirely.
+        """
+        self._sysfs = SysfsReader()
+        self._detect_vendors = set(detect_vendors)
+        self._gpus: Optional[List[Dict]] = None
+        self._stream_proc = None
+        self._stream_thread = None
+        self._latest_metrics: Dict[int, GPUMetrics] = {}
+        self._metrics_cache: Dict[int, tuple] = {}  # gpu_index -> (monotonic_ns, GPUMetrics)
+        self._nvidia_disabled = False
+        self._nvml = False
+        self._nvml_failed = False
+
+    @property
+    def gpus(self) -> List[Dict]:
+        """Detected GPUs; detection runs lazily on first access"""
+        if self._gpus is None:
+            self._gpus = self._detect_all_gpus()
+        return self._gpus
+
+    @gpus.setter
+    def gpus(self, value: List[Dict]):
+        self._gpus = value
+
+    @property
+    def primary_gpu(self) -> Optional[Dict]:
+        """First detected GPU, or None"""
+        return self.gpus[0] if self.gpus else None
+
+    def _ensure_nvml(self) -> bool:
+        """Initialize NVML once, on first NVIDIA probe"""
+        if self._nvml or pynvml is None or self._nvml_failed:
+            return self._nvml
+        try:
+            pynvml.nvmlInit()
+            self._nvml = True
+        except Exception:
+            # No driver / library mismatch - fall back to nvidia-smi
+            self._nvml_failed = True
+        return self._nvml
+
+    def close(self):
+        """Release cached sysfs file descriptors and shut down NVML"""
+        self.stop_streaming()
+        self._sysfs.close()
+        if self._nvml:
+            try:
+                pynvml.nvmlShutdown()
+            except Exception:
+                pass
+            self._nvml = False
+
+    def __del__(self):
+        self.close()
 
     def _detect_all_gpus(self) -> List[Dict]:
-        """Detect all GPUs in the system"""
-        gpus = []
-
-        # Try NVIDIA
-        nvidia_gpus = self._detect_nvidia_gpus()
-        gpus.extend(nvidia_gpus)
-
-        # Try AMD
-        amd_gpus = self._detect_amd_gpus()
-        gpus.extend(amd_gpus)
-
-        # Try Intel
-        intel_gpus = self._detect_intel_gpus()
-        gpus.extend(intel_gpus)
+        """Detect all GPUs in the system.
+
+        The three vendor probes are independent I/O (subprocess or sysfs),
+        so run them concurrently and merge in a stable vendor order.
+        """
+        probes = [
+            ("nvidia", self._detect_nvidia_gpus),
+            ("amd", self._detect_amd_gpus),
+            ("intel", self._detect_intel_gpus),
+        ]
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [
+                executor.submit(probe)
+                for vendor, probe in probes
+                if vendor in self._detect_vendors
+            ]
+
+            gpus = []
+            for future in futures:
+                gpus.extend(future.result())
 
         return gpus
 
+    def _mark_nvidia_disabled(self, reason: str):
+        """Stop probing NVIDIA for the rest of the process (log once)"""
+        if not self._nvidia_disabled:
+            self._nvidia_disabled = True
+            print(f"⚠️  NVIDIA probing disabled: {reason}")
+
     def _detect_nvidia_gpus(self) -> List[Dict]:
-        """Detect NVIDIA GPUs using nvidia-smi"""
+        """Detect NVIDIA GPUs via NVML, falling back to nvidia-smi"""
         gpus = []
+
+        if self._nvidia_disabled or not _nvidia_driver_present():
+            return gpus
+
+        # Preferred path: NVML enumeration with cached device handles
+        if self._ensure_nvml():
+            try:
+                for i in range(pynvml.nvmlDeviceGetCount()):
+                    handle = pynvml.nvmlDeviceGetHandleByIndex(i)
+                    name = pynvml.nvmlDeviceGetName(handle)
+                    if isinstance(name, bytes):
+                        name = name.decode()
+                    try:
+                        uuid = pynvml.nvmlDeviceGetUUID(handle)
+                        if isinstance(uuid, bytes):
+                            uuid = uuid.decode()
+                    except Exception:
+                        uuid = None
+
+                    gpus.append({
+                        'vendor': GPUVendor.NVIDIA,
+                        'index': i,
+                        'name': name,
+                        'uuid': uuid,
+                        'handle': handle
+                    })
+                return gpus
+            except Exception:
+                gpus = []  # NVML flaked - try the subprocess path below
+
         try:
             # Check if nvidia-smi is available
             result = subprocess.run(
                 ["nvidia-smi", "--query-gpu=index,name,uuid", "--format=csv,noheader"],
                 capture_output=True,
                 text=True,
-                timeout=5
+                timeout=NVIDIA_SMI_TIMEOUT
             )
 
             if result.returncode == 0:
@@ -89,7 +247,9 @@ class UniversalGPUMonitor:
                                 'name': parts[1],
                                 'uuid': parts[2] if len(parts) > 2 else None
                             })
-        except (FileNotFoundError, subprocess.TimeoutExpired, Exception):
+        except subprocess.TimeoutExpired:
+            self._mark_nvidia_disabled(f"nvidia-smi detection exceeded {NVIDIA_SMI_TIMEOUT}s")
+        except (FileNotFoundError, Exception):
             pass
 
         return gpus
@@ -97,172 +257,314 @@ class UniversalGPUMonitor:
     def _detect_amd_gpus(self) -> List[Dict]:
         """Detect AMD GPUs via sysfs"""
         gpus = []
-        drm_path = Path("/sys/class/drm")
 
-        if drm_path.exists():
-            for card_dir in sorted(drm_path.glob("card[0-9]*")):
-                # Skip card*-* (connectors)
-                if "-" in card_dir.name:
-                    continue
+        for card_dir in sorted(Path("/sys/class/drm").glob("card[0-9]*")):
+            # Skip card*-* (connectors)
+            if "-" in card_dir.name:
+                continue
 
-                device_dir = card_dir / "device"
-                if not device_dir.exists():
-                    continue
+            device_dir = card_dir / "device"
+
+            # EAFP: just read the vendor file; a missing one means no PCI device
+            try:
+                vendor_id = (device_dir / "vendor").read_bytes().strip()
+            except OSError:
+                continue
 
-                # Check vendor ID
-                vendor_file = device_dir / "vendor"
-                if vendor_file.exists():
-                    vendor_id = vendor_file.read_text().strip()
-                    if vendor_id == "0x1002":  # AMD
-                        # Get device name
-                        name = "AMD GPU"
-                        try:
-                            # Try to get GPU name from uevent
-                            uevent = (device_dir / "uevent").read_text()
-                            pci_id_match = re.search(r"PCI_ID=([0-9A-Fa-f:]+)", uevent)
-                            if pci_id_match:
-                                name = f"AMD GPU {pci_id_match.group(1)}"
-                        except Exception:
-                            pass
-
-                        gpus.append({
-                            'vendor': GPUVendor.AMD,
-                            'index': len(gpus),
-                            'name': name,
-                            'device_path': str(card_dir)
-                        })
+            if vendor_id != b"0x1002":  # AMD
+                continue
+
+            # Get device name
+            name = "AMD GPU"
+            try:
+                # uevent is a small KEY=VAL file; a startswith scan beats regex
+                for line in (device_dir / "uevent").read_text().splitlines():
+                    if line.startswith("PCI_ID="):
+                        name = f"AMD GPU {line[7:]}"
+                        break
+            except Exception:
+                pass
+
+            gpu = {
+                'vendor': GPUVendor.AMD,
+                'index': len(gpus),
+                'name': name,
+                'device_path': str(card_dir)
+            }
+            gpu.update(self._resolve_hwmon_paths(card_dir))
+            gpus.append(gpu)
 
         return gpus
 
     def _detect_intel_gpus(self) -> List[Dict]:
         """Detect Intel integrated GPUs via sysfs"""
         gpus = []
-        drm_path = Path("/sys/class/drm")
 
-        if drm_path.exists():
-            for card_dir in sorted(drm_path.glob("card[0-9]*")):
-                if "-" in card_dir.name:
-                    continue
+        for card_dir in sorted(Path("/sys/class/drm").glob("card[0-9]*")):
+            if "-" in card_dir.name:
+                continue
 
-                device_dir = card_dir / "device"
-                if not device_dir.exists():
-                    continue
+            try:
+                vendor_id = (card_dir / "device" / "vendor").read_bytes().strip()
+            except OSError:
+                continue
 
-                vendor_file = device_dir / "vendor"
-                if vendor_file.exists():
-                    vendor_id = vendor_file.read_text().strip()
-                    if vendor_id == "0x8086":  # Intel
-                        name = "Intel Integrated Graphics"
+            if vendor_id != b"0x8086":  # Intel
+                continue
 
-                        gpus.append({
-                            'vendor': GPUVendor.INTEL,
-                            'index': len(gpus),
-                            'name': name,
-                            'device_path': str(card_dir)
-                        })
+            gpu = {
+                'vendor': GPUVendor.INTEL,
+                'index': len(gpus),
+                'name': "Intel Integrated Graphics",
+                'device_path': str(card_dir)
+            }
+            gpu.update(self._resolve_hwmon_paths(card_dir))
+            gpus.append(gpu)
 
         return gpus
 
+    def _resolve_hwmon_paths(self, card_path: Path) -> Dict[str, Optional[Path]]:
+        """Resolve concrete hwmon file paths for a DRM card once at detection.
+
+        Globbing and label scanning are expensive (readdir + stat per
+        pattern), but the resulting paths never change while the card is
+        plugged in, so the metric readers just open these cached paths.
+        """
+        paths: Dict[str, Optional[Path]] = {
+            'hwmon_path': None,
+            'temp_input_path': None,
+            'pwm_path': None,
+            'fan_input_path': None,
+            'power_avg_path': None,
+        }
+
+        hwmon_subdirs = list((card_path / "device" / "hwmon").glob("hwmon*"))
+        if not hwmon_subdirs:
+            return paths
+
+        hwmon_path = hwmon_subdirs[0]
+        paths['hwmon_path'] = hwmon_path
+        paths['temp_input_path'] = self._pick_temp_input(hwmon_path)
+
+        pwm_files = sorted(hwmon_path.glob("pwm[0-9]"))
+        if pwm_files:
+            paths['pwm_path'] = pwm_files[0]
+
+        fan_input_files = sorted(hwmon_path.glob("fan*_input"))
+        if fan_input_files:
+            paths['fan_input_path'] = fan_input_files[0]
+
+        power_files = sorted(hwmon_path.glob("power*_average"))
+        if power_files:
+            paths['power_avg_path'] = power_files[0]
+
+        return paths
+
+    @staticmethod
+    def _pick_temp_input(hwmon_path: Path) -> Optional[Path]:
+        """Pick the temp*_input to sample for a hwmon chip, once.
+
+        Labels are static for the life of the device, so the winning
+        edge/junction sensor is resolved here and the per-poll readers
+        never touch a label file again.
+        """
+        temp_inputs = sorted(hwmon_path.glob("temp*_input"))
+        for temp_file in temp_inputs:
+            label_file = hwmon_path / temp_file.name.replace("_input", "_label")
+            try:
+                label = label_file.read_text().strip().lower()
+            except OSError:
+                continue
+            if "edge" in label or "junction" in label:
+                return temp_file
+
+        return temp_inputs[0] if temp_inputs else None
+
+    def _nvidia_gpu(self, gpu_index: int) -> Optional[Dict]:
+        """Find the detected NVIDIA GPU dict for a given index"""
+        for gpu in self.gpus:
+            if gpu['vendor'] == GPUVendor.NVIDIA and gpu.get('index') == gpu_index:
+                return gpu
+        return None
+
+    def _get_nvml_metrics(self, gpu: Dict) -> Optional[GPUMetrics]:
+        """Get NVIDIA metrics through NVML on the cached device handle"""
+        handle = gpu['handle']
+
+        def _query(fn, *args):
+            try:
+                return fn(handle, *args)
+            except pynvml.NVMLError:
+                return None  # Sensor not supported on this GPU
+
+        try:
+            temperature = _query(pynvml.nvmlDeviceGetTemperature, pynvml.NVML_TEMPERATURE_GPU)
+            fan_speed = _query(pynvml.nvmlDeviceGetFanSpeed)
+            power = _query(pynvml.nvmlDeviceGetPowerUsage)                 # mW
+            power_limit = _query(pynvml.nvmlDeviceGetPowerManagementLimit) # mW
+            utilization = _query(pynvml.nvmlDeviceGetUtilizationRates)
+            memory = _query(pynvml.nvmlDeviceGetMemoryInfo)
+
+            return GPUMetrics(
+                vendor=GPUVendor.NVIDIA,
+                name=gpu.get('name', "NVIDIA GPU"),
+                temperature=temperature,
+                fan_speed=fan_speed,
+                fan_rpm=None,  # NVML doesn't provide RPM directly
+                power_usage=power // 1000 if power is not None else None,
+                power_limit=power_limit // 1000 if power_limit is not None else None,
+                utilization=utilization.gpu if utilization is not None else None,
+                memory_used=memory.used // (1024 * 1024) if memory is not None else None,
+                memory_total=memory.total // (1024 * 1024) if memory is not None else None,
+                device_path=None
+            )
+        except Exception as e:
+            print(f"NVIDIA metrics error: {e}")
+            return None
+
+    def _metrics_from_csv_values(self, gpu: Optional[Dict], values: List[bytes]) -> GPUMetrics:
+        """Build GPUMetrics from the 7 nvidia-smi CSV columns (raw bytes)"""
+        return GPUMetrics(
+            vendor=GPUVendor.NVIDIA,
+            name=gpu['name'] if gpu else "NVIDIA GPU",
+            temperature=_csv_int(values[0]),
+            fan_speed=_csv_int(values[1]),
+            fan_rpm=None,  # nvidia-smi doesn't provide RPM directly
+            power_usage=_csv_int(values[2]),
+            power_limit=_csv_int(values[3]),
+            utilization=_csv_int(values[4]),
+            memory_used=_csv_int(values[5]),
+            memory_total=_csv_int(values[6]),
+            device_path=None
+        )
+
+    def start_streaming(self, interval_ms: int = 1000) -> bool:
+        """Start one long-lived nvidia-smi loop-mode child for polling.
+
+        Cold-starting nvidia-smi reinitializes the driver on every fork;
+        with a single --loop-ms child, each subsequent sample is just a
+        read of the latest CSV line from the pipe.
+        """
+        if self._stream_proc is not None:
+            return True
+
+        if not any(g['vendor'] == GPUVendor.NVIDIA for g in self.gpus):
+            return False
+
+        try:
+            self._stream_proc = subprocess.Popen(
+                ["nvidia-smi", f"--loop-ms={interval_ms}",
+                 f"--query-gpu=index,{_NVIDIA_QUERY}",
+                 "--format=csv,noheader,nounits"],
+                stdout=subprocess.PIPE
+            )
+        except Exception:
+            self._stream_proc = None
+            return False
+
+        self._stream_thread = Thread(target=self._stream_reader, daemon=True)
+        self._stream_thread.start()
+        return True
+
+    def stop_streaming(self):
+        """Terminate and reap the streaming nvidia-smi child"""
+        proc = self._stream_proc
+        if proc is None:
+            return
+
+        self._stream_proc = None
+        try:
+            proc.terminate()
+            proc.wait(timeout=3)
+        except Exception:
+            try:
+                proc.kill()
+            except Exception:
+                pass
+
+        if self._stream_thread is not None:
+            self._stream_thread.join(timeout=1)
+            self._stream_thread = None
+
+        self._latest_metrics.clear()
+
+    def _stream_reader(self):
+        """Background reader keeping the latest metrics per GPU index"""
+        proc = self._stream_proc
+        if proc is None:
+            return
+
+        try:
+            for line in proc.stdout:
+                values = line.strip().split(b',')
+                if len(values) != 8:
+                    continue
+                try:
+                    index = int(values[0])
+                except ValueError:
+                    continue
+                gpu = self._nvidia_gpu(index)
+                self._latest_metrics[index] = self._metrics_from_csv_values(gpu, values[1:])
+        except Exception:
+            pass  # Pipe closed on stop_streaming / child exit
+
     def get_nvidia_metrics(self, gpu_index: int = 0) -> Optional[GPUMetrics]:
         """Get metrics for NVIDIA GPU"""
+        if self._nvidia_disabled or not _nvidia_driver_present():
+            return None
+
+        # Streaming child keeps the freshest sample in memory
+        if self._stream_proc is not None:
+            metrics = self._latest_metrics.get(gpu_index)
+            if metrics is not None:
+                return metrics
+
+        gpu = self._nvidia_gpu(gpu_index)
+        if self._nvml and gpu is not None and 'handle' in gpu:
+            return self._get_nvml_metrics(gpu)
+
         try:
-            # Query multiple metrics at once
-            query = "temperature.gpu,fan.speed,power.draw,power.limit,utilization.gpu,memory.used,memory.total"
+            # Query all metrics with a single nvidia-smi invocation
             result = subprocess.run(
                 ["nvidia-smi", f"--id={gpu_index}",
-                 f"--query-gpu={query}",
+                 f"--query-gpu={_NVIDIA_QUERY}",
                  "--format=csv,noheader,nounits"],
                 capture_output=True,
-                text=True,
-                timeout=5
+                timeout=NVIDIA_SMI_TIMEOUT
             )
 
             if result.returncode != 0:
                 return None
 
-            # Parse output
-            values = [v.strip() for v in result.stdout.strip().split(',')]
-
-            # Get GPU name
-            name_result = subprocess.run(
-                ["nvidia-smi", f"--id={gpu_index}", "--query-gpu=name", "--format=csv,noheader"],
-                capture_output=True,
-                text=True,
-                timeout=3
-            )
-            name = name_result.stdout.strip() if name_result.returncode == 0 else "NVIDIA GPU"
-
-            return GPUMetrics(
-                vendor=GPUVendor.NVIDIA,
-                name=name,
-                temperature=int(float(values[0])) if values[0] != 'N/A' else None,
-                fan_speed=int(float(values[1])) if values[1] != 'N/A' else None,
-                fan_rpm=None,  # nvidia-smi doesn't provide RPM directly
-                power_usage=int(float(values[2])) if values[2] != 'N/A' else None,
-                power_limit=int(float(values[3])) if values[3] != 'N/A' else None,
-                utilization=int(float(values[4])) if values[4] != 'N/A' else None,
-                memory_used=int(float(values[5])) if values[5] != 'N/A' else None,
-                memory_total=int(float(values[6])) if values[6] != 'N/A' else None,
-                device_path=None
-            )
+            # Parse output as bytes - no decode, no per-column str objects
+            values = result.stdout.strip().split(b',')
+            return self._metrics_from_csv_values(gpu, values)
 
+        except subprocess.TimeoutExpired:
+            self._mark_nvidia_disabled(f"nvidia-smi query exceeded {NVIDIA_SMI_TIMEOUT}s")
+            return None
         except Exception as e:
             print(f"NVIDIA metrics error: {e}")
             return None
 
-    def get_amd_metrics(self, device_path: str) -> Optional[GPUMetrics]:
-        """Get metrics for AMD GPU via sysfs"""
+    def get_amd_metrics(self, gpu: Dict, _retry: bool = True) -> Optional[GPUMetrics]:
+        """Get metrics for AMD GPU via the sysfs paths cached at detection"""
         try:
-            card_path = Path(device_path)
-            device_dir = card_path / "device"
-            hwmon_dir = device_dir / "hwmon"
-
-            name = "AMD GPU"
-            temperature = None
-            fan_speed = None
-            fan_rpm = None
-            power_usage = None
-
-            # Find hwmon directory
-            hwmon_path = None
-            if hwmon_dir.exists():
-                hwmon_subdirs = list(hwmon_dir.glob("hwmon*"))
-                if hwmon_subdirs:
-                    hwmon_path = hwmon_subdirs[0]
-
-            if hwmon_path:
-                # Temperature (look for edge temperature)
-                temp_inputs = list(hwmon_path.glob("temp*_input"))
-                for temp_file in temp_inputs:
-                    label_file = temp_file.parent / temp_file.name.replace("_input", "_label")
-                    if label_file.exists():
-                        label = label_file.read_text().strip()
-                        if "edge" in label.lower() or "junction" in label.lower():
-                            temp_milli = int(temp_file.read_text().strip())
-                            temperature = temp_milli // 1000
-                            break
-
-                # If no labeled temp found, use first temp sensor
-                if temperature is None and temp_inputs:
-                    temp_milli = int(temp_inputs[0].read_text().strip())
-                    temperature = temp_milli // 1000
-
-                # Fan speed (PWM = 0-255, convert to percentage)
-                pwm_files = list(hwmon_path.glob("pwm[0-9]"))
-                if pwm_files:
-                    pwm_value = int(pwm_files[0].read_text().strip())
-                    fan_speed = int((pwm_value / 255) * 100)
-
-                # Fan RPM
-                fan_input_files = list(hwmon_path.glob("fan*_input"))
-                if fan_input_files:
-                    fan_rpm = int(fan_input_files[0].read_text().strip())
-
-                # Power usage
-                power_files = list(hwmon_path.glob("power*_average"))
-                if power_files:
-                    power_micro = int(power_files[0].read_text().strip())
-                    power_usage = power_micro // 1000000  # Convert to watts
+            name = gpu.get('name', "AMD GPU")
+
+            # One batched pass of preads over the cached descriptors
+            temp_raw, pwm_raw, fan_raw, power_raw = self._sysfs.read_many((
+                gpu.get('temp_input_path'),
+                gpu.get('pwm_path'),
+                gpu.get('fan_input_path'),
+                gpu.get('power_avg_path'),
+            ))
+
+            temperature = int(temp_raw) // 1000 if temp_raw is not None else None
+            # Fan speed (PWM = 0-255, convert to percentage)
+            fan_speed = _PWM_TO_PCT[int(pwm_raw)] if pwm_raw is not None else None
+            fan_rpm = int(fan_raw) if fan_raw is not None else None
+            power_usage = int(power_raw) // 1000000 if power_raw is not None else None  # Watts
 
             return GPUMetrics(
                 vendor=GPUVendor.AMD,
@@ -275,43 +577,31 @@ class UniversalGPUMonitor:
                 utilization=None,  # AMD doesn't expose this easily
                 memory_used=None,
                 memory_total=None,
-                device_path=device_path
+                device_path=gpu.get('device_path')
             )
 
+        except FileNotFoundError:
+            # Cached paths went stale (hotplug/driver reload) - re-resolve once
+            if _retry and gpu.get('device_path'):
+                gpu.update(self._resolve_hwmon_paths(Path(gpu['device_path'])))
+                return self.get_amd_metrics(gpu, _retry=False)
+            return None
         except Exception as e:
             print(f"AMD metrics error: {e}")
             return None
 
-    def get_intel_metrics(self, device_path: str) -> Optional[GPUMetrics]:
-        """Get metrics for Intel iGPU via sysfs"""
+    def get_intel_metrics(self, gpu: Dict, _retry: bool = True) -> Optional[GPUMetrics]:
+        """Get metrics for Intel iGPU via the sysfs paths cached at detection"""
         try:
-            card_path = Path(device_path)
-            device_dir = card_path / "device"
-            hwmon_dir = device_dir / "hwmon"
-
-            name = "Intel Integrated Graphics"
-            temperature = None
-            power_usage = None
-
-            # Find hwmon directory
-            hwmon_path = None
-            if hwmon_dir.exists():
-                hwmon_subdirs = list(hwmon_dir.glob("hwmon*"))
-                if hwmon_subdirs:
-                    hwmon_path = hwmon_subdirs[0]
-
-            if hwmon_path:
-                # Temperature
-                temp_inputs = list(hwmon_path.glob("temp*_input"))
-                if temp_inputs:
-                    temp_milli = int(temp_inputs[0].read_text().strip())
-                    temperature = temp_milli // 1000
-
-                # Power
-                power_files = list(hwmon_path.glob("power*_average"))
-                if power_files:
-                    power_micro = int(power_files[0].read_text().strip())
-                    power_usage = power_micro // 1000000
+            name = gpu.get('name', "Intel Integrated Graphics")
+
+            temp_raw, power_raw = self._sysfs.read_many((
+                gpu.get('temp_input_path'),
+                gpu.get('power_avg_path'),
+            ))
+
+            temperature = int(temp_raw) // 1000 if temp_raw is not None else None
+            power_usage = int(power_raw) // 1000000 if power_raw is not None else None
 
             return GPUMetrics(
                 vendor=GPUVendor.INTEL,
@@ -324,39 +614,142 @@ class UniversalGPUMonitor:
                 utilization=None,
                 memory_used=None,
                 memory_total=None,
-                device_path=device_path
+                device_path=gpu.get('device_path')
             )
 
+        except FileNotFoundError:
+            # Cached paths went stale (hotplug/driver reload) - re-resolve once
+            if _retry and gpu.get('device_path'):
+                gpu.update(self._resolve_hwmon_paths(Path(gpu['device_path'])))
+                return self.get_intel_metrics(gpu, _retry=False)
+            return None
         except Exception as e:
             print(f"Intel metrics error: {e}")
             return None
 
     def get_metrics(self, gpu_index: int = 0) -> Optional[GPUMetrics]:
-        """Get metrics for specified GPU"""
+        """Get metrics for specified GPU (cached within the sensor's TTL)"""
         if gpu_index >= len(self.gpus):
             return None
 
         gpu = self.gpus[gpu_index]
         vendor = gpu['vendor']
 
+        # Serve from cache while the hardware can't have produced new data
+        now = time.monotonic_ns()
+        cached = self._metrics_cache.get(gpu_index)
+        if cached is not None and now - cached[0] < _CACHE_TTL_NS.get(vendor, 0):
+            return cached[1]
+
+        metrics = None
         if vendor == GPUVendor.NVIDIA:
-            return self.get_nvidia_metrics(gpu.get('index', 0))
+            metrics = self.get_nvidia_metrics(gpu.get('index', 0))
         elif vendor == GPUVendor.AMD:
-            return self.get_amd_metrics(gpu['device_path'])
+            metrics = self.get_amd_metrics(gpu)
         elif vendor == GPUVendor.INTEL:
-            return self.get_intel_metrics(gpu['device_path'])
+            metrics = self.get_intel_metrics(gpu)
 
-        return None
+        if metrics is not None:
+            self._metrics_cache[gpu_index] = (now, metrics)
 
-    def get_all_metrics(self) -> List[GPUMetrics]:
-        """Get metrics for all GPUs"""
-        metrics = []
-        for i in range(len(self.gpus)):
-            m = self.get_metrics(i)
-            if m:
-                metrics.append(m)
         return metrics
 
+    async def _run_nvidia_smi_async(self, args: List[str], timeout: float) -> Optional[bytes]:
+        """Run nvidia-smi without blocking the caller's event loop"""
+        proc = await asyncio.create_subprocess_exec(
+            "nvidia-smi", *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL
+        )
+        try:
+            stdout, _ = await asyncio.wait_for(proc.communicate(), timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            self._mark_nvidia_disabled(f"nvidia-smi query exceeded {timeout}s")
+            return None
+
+        if proc.returncode != 0:
+            return None
+        return stdout
+
+    async def get_nvidia_metrics_async(self, gpu_index: int = 0) -> Optional[GPUMetrics]:
+        """Async variant of get_nvidia_metrics"""
+        if self._nvidia_disabled or not _nvidia_driver_present():
+            return None
+
+        # Streaming child keeps the freshest sample in memory
+        if self._stream_proc is not None:
+            metrics = self._latest_metrics.get(gpu_index)
+            if metrics is not None:
+                return metrics
+
+        gpu = self._nvidia_gpu(gpu_index)
+        if self._nvml and gpu is not None and 'handle' in gpu:
+            # NVML calls are sub-millisecond; no need to leave the loop
+            return self._get_nvml_metrics(gpu)
+
+        try:
+            stdout = await self._run_nvidia_smi_async(
+                [f"--id={gpu_index}", f"--query-gpu={_NVIDIA_QUERY}",
+                 "--format=csv,noheader,nounits"],
+                NVIDIA_SMI_TIMEOUT
+            )
+        except Exception as e:
+            print(f"NVIDIA metrics error: {e}")
+            return None
+
+        if stdout is None:
+            return None
+
+        values = stdout.strip().split(b',')
+        return self._metrics_from_csv_values(gpu, values)
+
+    async def get_metrics_async(self, gpu_index: int = 0) -> Optional[GPUMetrics]:
+        """Async variant of get_metrics; never blocks the event loop"""
+        if gpu_index >= len(self.gpus):
+            return None
+
+        gpu = self.gpus[gpu_index]
+        if gpu['vendor'] == GPUVendor.NVIDIA:
+            now = time.monotonic_ns()
+            cached = self._metrics_cache.get(gpu_index)
+            if cached is not None and now - cached[0] < _CACHE_TTL_NS[GPUVendor.NVIDIA]:
+                return cached[1]
+
+            metrics = await self.get_nvidia_metrics_async(gpu.get('index', 0))
+            if metrics is not None:
+                self._metrics_cache[gpu_index] = (now, metrics)
+            return metrics
+
+        # AMD/Intel metrics are sysfs reads - quick, but still syscalls;
+        # run them in the default executor so the loop stays responsive
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.get_metrics, gpu_index)
+
+    async def get_all_metrics_async(self) -> List[GPUMetrics]:
+        """Async variant of get_all_metrics, gathering all GPUs at once"""
+        results = await asyncio.gather(
+            *(self.get_metrics_async(i) for i in range(len(self.gpus)))
+        )
+        return [m for m in results if m]
+
+    def _query_all_metrics(self) -> List[Optional[GPUMetrics]]:
+        """Query every GPU concurrently, keeping index alignment.
+
+        Each query hits an independent device (sysfs files or nvidia-smi),
+        so total latency is the slowest GPU instead of the sum of all.
+        """
+        if not self.gpus:
+            return []
+
+        with ThreadPoolExecutor(max_workers=len(self.gpus)) as executor:
+            return list(executor.map(self.get_metrics, range(len(self.gpus))))
+
+    def get_all_metrics(self) -> List[GPUMetrics]:
+        """Get metrics for all GPUs, querying them concurrently"""
+        return [m for m in self._query_all_metrics() if m]
+
     def print_metrics(self, metrics: GPUMetrics):
         """Print GPU metrics in human-readable format"""
         print(f"🎮 {metrics.name} ({metrics.vendor.value.upper()})")
@@ -398,10 +791,15 @@ class UniversalGPUMonitor:
         lines.append(f"📊 Detected GPUs: {len(self.gpus)}")
         lines.append("")
 
+        # One concurrent bulk query; the loop below only indexes into it.
+        # The TTL cache it fills also makes an immediately following
+        # get_all_metrics() call free instead of a second fork storm.
+        all_metrics = self._query_all_metrics()
+
         for i, gpu in enumerate(self.gpus):
             lines.append(f"GPU #{i}: {gpu['name']} ({gpu['vendor'].value.upper()})")
 
-            metrics = self.get_metrics(i)
+            metrics = all_metrics[i]
             if metrics:
                 if metrics.temperature is not None:
                     lines.append(f"  🌡️  Temperature: {metrics.temperature}°C")
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Persistent sysfs I/O helper
+Keeps sysfs attribute files open across polls and rereads them with pread,
+avoiding the open/close (and path lookup) cost of reopening every sample
+"""
+
+import os
+from typing import Dict
+
+
+class SysfsReader:
+    """Cache of open sysfs file descriptors, reread with os.pread.
+
+    sysfs attribute files can be kept open and reread from offset 0 to get
+    a fresh value, so each sample costs a single pread() instead of
+    open+read+close. Descriptors that go stale (device removal, driver
+    reload) are dropped and reopened transparently on the next access.
+    """
+
+    def __init__(self):
+        self._read_fds: Dict[str, int] = {}
+        self._write_fds: Dict[str, int] = {}
+
+    def read(self, path, size: int = 64) -> bytes:
+        """Read a sysfs attribute, reusing the cached fd when possible"""
+        path = str(path)
+        fd = self._read_fds.get(path)
+        if fd is None:
+            fd = os.open(path, os.O_RDONLY)
+            self._read_fds[path] = fd
+        try:
+            return os.pread(fd, size, 0)
+        except OSError:
+            # Device may have gone away and come back - retry with a new fd
+            self._drop(self._read_fds, path)
+            fd = os.open(path, os.O_RDONLY)
+            self._read_fds[path] = fd
+            return os.pread(fd, size, 0)
+
+    def read_many(self, paths, size: int = 64):
+        """Read several attributes back-to-back over cached descriptors.
+
+        Distinct sysfs files cannot share one preadv() call (it scatters
+        buffers within a single fd), so this is a tight pread loop over
+        already-open descriptors: one syscall per attribute with no
+        open/close between samples. None entries in paths yield None
+        results, keeping positions aligned for tuple unpacking.
+        """
+        return [self.read(path, size) if path else None for path in paths]
+
+    def write(self, path, data: bytes) -> None:
+        """Write a sysfs attribute, reusing the cached write fd"""
+        path = str(path)
+        fd = self._write_fds.get(path)
+        if fd is None:
+            fd = os.open(path, os.O_WRONLY)
+            self._write_fds[path] = fd
+        try:
+            # pwrite at offset 0 so the cached fd can be reused; plain
+            # write() would advance the offset between calls
+            os.pwrite(fd, data, 0)
+        except OSError:
+            # Don't keep a descriptor that just failed (EBUSY/EACCES/...)
+            self._drop(self._write_fds, path)
+            raise
+
+    def _drop(self, table: Dict[str, int], path: str) -> None:
+        fd = table.pop(path, None)
+        if fd is not None:
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+    def close(self) -> None:
+        """Close all cached descriptors"""
+        for table in (self._read_fds, self._write_fds):
+            for fd in table.values():
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+            table.clear()
+
+    def __del__(self):
+        self.close()
@@ -6,14 +6,49 @@ Works on atypical motherboards, all-in-one PCs, exotic configurations
 Finds: CPU temps, GPU temps, motherboard sensors, fan sensors, voltage, power
 """
 
+import json
 import os
 import re
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Optional
 from dataclasses import dataclass
 from enum import Enum
 
+try:
+    # Optional: submit all per-poll sensor reads in one io_uring batch
+    import liburing
+except ImportError:
+    liburing = None
+
+try:
+    from sensors import _libsensors
+except ImportError:
+    import _libsensors
+
+
+# lm-sensors value patterns, compiled once at import - _parse_sensor_line
+# runs for every line of output, so per-call re.search lookups add up
+_TEMP_RE = re.compile(r'([+-]?\d+\.?\d*)\s*°?C')
+_FAN_RE = re.compile(r'(\d+)\s*RPM', re.IGNORECASE)
+_VOLT_RE = re.compile(r'([+-]?\d+\.?\d*)\s*V')
+_POWER_RE = re.compile(r'(\d+\.?\d*)\s*W')
+
+
+def _read_small(path: str, size: int = 32) -> bytes:
+    """Read a small sysfs file with raw os-level I/O.
+
+    Path.read_text() drags in a TextIOWrapper and the codec pipeline,
+    which dominates for files of a few bytes; int() accepts the raw
+    bytes directly, so most call sites never decode at all.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return os.read(fd, size)
+    finally:
+        os.close(fd)
+
 
 class SensorType(Enum):
     TEMPERATURE = "temperature"
@@ -26,9 +61,27 @@ class SensorType(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+class PollClass(Enum):
+    """How often a sensor's value is worth re-reading.
+
+    Temperatures and fan speeds move on millisecond scales; battery
+    energy and voltage rails are quasi-static, so re-reading them every
+    tick is wasted I/O. Pollers refresh FAST sensors each tick and SLOW
+    ones on a divided schedule.
+    """
+    FAST = "fast"
+    SLOW = "slow"
+
+
+@dataclass(slots=True)
 class Sensor:
-    """Individual sensor data"""
+    """Individual sensor data.
+
+    slots=True drops the per-instance __dict__; on a box with dozens of
+    sensors that roughly halves per-object memory and makes the
+    attribute reads in the poll path slot-descriptor fast. Not frozen:
+    refresh() updates value/fd in place.
+    """
     name: str
     type: SensorType
     value: Optional[float]
@@ -36,6 +89,83 @@ class Sensor:
     path: Optional[str]
     chip: str
     label: str
+    scale: float = 1.0            # Raw sysfs integer -> value multiplier
+    fd: Optional[int] = None      # Cached descriptor for refresh()
+    poll_class: PollClass = PollClass.FAST
+
+    def refresh(self) -> Optional[float]:
+        """Re-read the current value over a cached descriptor.
+
+        sysfs files can be kept open and reread from offset 0, so each
+        refresh costs one pread() instead of open+read+close. Sensors
+        without a path (lm-sensors output) keep their detection value;
+        a descriptor that goes stale is dropped and reopened next time.
+        """
+        if self.path is None:
+            return self.value
+
+        if self.fd is None:
+            try:
+                self.fd = os.open(self.path, os.O_RDONLY)
+            except OSError:
+                return self.value
+
+        try:
+            self.value = int(os.pread(self.fd, 32, 0)) * self.scale
+        except (OSError, ValueError):
+            self.close()
+        return self.value
+
+    def close(self):
+        """Close the cached descriptor, if any"""
+        if self.fd is not None:
+            try:
+                os.close(self.fd)
+            except OSError:
+                pass
+            self.fd = None
+
+
+# hwmon feature prefix -> (sensor type, unit, raw-integer scale)
+_HWMON_FEATURES = {
+    'temp': (SensorType.TEMPERATURE, "°C", 0.001),
+    'fan': (SensorType.FAN, "RPM", 1.0),
+    'in': (SensorType.VOLTAGE, "V", 0.001),
+    'power': (SensorType.POWER, "W", 0.000001),
+}
+
+
+# libsensors feature type -> sensor type and unit (values arrive
+# already scaled to natural units)
+_LIBSENSORS_TYPES = {
+    _libsensors.FEATURE_TEMP: (SensorType.TEMPERATURE, "°C"),
+    _libsensors.FEATURE_FAN: (SensorType.FAN, "RPM"),
+    _libsensors.FEATURE_IN: (SensorType.VOLTAGE, "V"),
+    _libsensors.FEATURE_POWER: (SensorType.POWER, "W"),
+    _libsensors.FEATURE_ENERGY: (SensorType.ENERGY, "J"),
+    _libsensors.FEATURE_CURR: (SensorType.CURRENT, "A"),
+}
+
+
+# Report icons per sensor type, built once instead of per report section
+_TYPE_ICONS = {
+    SensorType.TEMPERATURE: "🌡️",
+    SensorType.FAN: "💨",
+    SensorType.VOLTAGE: "⚡",
+    SensorType.POWER: "🔌",
+    SensorType.CURRENT: "⚡",
+    SensorType.ENERGY: "🔋",
+}
+
+
+# sensors -j subfeature prefix (digits stripped) -> sensor type and unit
+_JSON_SENSOR_TYPES = {
+    'temp': (SensorType.TEMPERATURE, "°C"),
+    'fan': (SensorType.FAN, "RPM"),
+    'in': (SensorType.VOLTAGE, "V"),
+    'power': (SensorType.POWER, "W"),
+    'curr': (SensorType.CURRENT, "A"),
+}
 
 
 class UniversalSensorDetector:
@@ -48,39 +178,100 @@ class UniversalSensorDetector:
     - GPU-specific (nvidia-smi, AMD/Intel sysfs)
     """
 
-    def __init__(self):
+    def __init__(self, use_lm_sensors: bool = False):
+        """
+        Args:
+            use_lm_sensors: Also fork the sensors(1) binary. Off by
+                default - it just re-reads the same hwmon files the sysfs
+                scan below covers, at fork+exec cost. Enable it only for
+                exotic chips that lm-sensors knows but have no hwmon
+                driver.
+        """
         self.sensors = []
+        self.by_type: Dict[SensorType, List[Sensor]] = {}
+        self._seen_keys = set()
+        self.use_lm_sensors = use_lm_sensors
         self._detect_all_sensors()
 
     def _detect_all_sensors(self):
-        """Detect all available sensors"""
-        # Method 1: lm-sensors (most comprehensive)
-        self._detect_lm_sensors()
-
-        # Method 2: sysfs hwmon
-        self._detect_sysfs_hwmon()
-
-        # Method 3: thermal zones
-        self._detect_thermal_zones()
+        """Detect all available sensors.
+
+        The detection methods are independent and I/O-bound (sysfs reads
+        and, opted in, a subprocess), so they run concurrently and their
+        result lists merge in a stable method order.
+        """
+        methods = []
+
+        # Method 1: lm-sensors (opt-in; subprocess per detection)
+        if self.use_lm_sensors:
+            methods.append(self._detect_lm_sensors)
+
+        # Methods 2-4: sysfs hwmon, thermal zones, ACPI power
+        methods.extend([
+            self._detect_sysfs_hwmon,
+            self._detect_thermal_zones,
+            self._detect_acpi_sensors,
+        ])
+
+        with ThreadPoolExecutor(max_workers=len(methods)) as executor:
+            futures = [executor.submit(method) for method in methods]
+            for future in futures:
+                for sensor in future.result():
+                    self._add(sensor)
+
+    def _add(self, sensor: Sensor):
+        """Insert a sensor, dropping duplicates and indexing by type.
+
+        Deduplicating at insert time keeps the merge single-pass; the
+        old post-hoc pass rebuilt the whole list and set after the fact.
+        """
+        key = (sensor.chip, sensor.label, sensor.type)
+        if key in self._seen_keys:
+            return
+        self._seen_keys.add(key)
+        self.sensors.append(sensor)
+        self.by_type.setdefault(sensor.type, []).append(sensor)
+
+    def _detect_lm_sensors(self) -> List[Sensor]:
+        """Detect sensors using lm-sensors.
+
+        Talks to libsensors.so in-process first (no fork/exec; the
+        library parses its chip config once per process). The sensors(1)
+        subprocess only runs when the library isn't installed - there
+        JSON output (-j) is preferred, with the regex text parser as a
+        last resort for old builds without JSON support.
+        """
+        try:
+            if _libsensors.available():
+                return self._detect_libsensors()
+        except Exception:
+            pass  # Library misbehaved - fall back to the binary
 
-        # Method 4: ACPI power
-        self._detect_acpi_sensors()
+        sensors = []
+        try:
+            result = subprocess.run(
+                ["sensors", "-A", "-j"],  # -A shows all sensors
+                capture_output=True,
+                text=True,
+                timeout=5
+            )
 
-        # Remove duplicates
-        self._deduplicate_sensors()
+            if result.returncode == 0:
+                try:
+                    return self._parse_sensors_json(result.stdout)
+                except ValueError:
+                    pass  # Malformed/unsupported JSON - fall back to text
 
-    def _detect_lm_sensors(self):
-        """Detect sensors using lm-sensors (sensors command)"""
-        try:
+            # Fallback: human-readable output parsed line by line
             result = subprocess.run(
-                ["sensors", "-A"],  # -A shows all sensors
+                ["sensors", "-A"],
                 capture_output=True,
                 text=True,
                 timeout=5
             )
 
             if result.returncode != 0:
-                return
+                return sensors
 
             current_chip = "unknown"
             for line in result.stdout.split('\n'):
@@ -102,307 +293,396 @@ class UniversalSensorDetector:
                     # Parse value
                     sensor = self._parse_sensor_line(label, value_str, current_chip)
                     if sensor:
-                        self.sensors.append(sensor)
+                        sensors.append(sensor)
 
         except (FileNotFoundError, subprocess.TimeoutExpired, Exception) as e:
             # lm-sensors not available, continue with other methods
             pass
 
+        return sensors
+
+    def _detect_libsensors(self) -> List[Sensor]:
+        """Collect readings over the in-process libsensors client"""
+        sensors = []
+        for chip, label, ftype, value in _libsensors.iter_readings():
+            mapped = _LIBSENSORS_TYPES.get(ftype)
+            if mapped is None:
+                continue
+            sensor_type, unit = mapped
+            sensors.append(Sensor(
+                name=f"{chip}/{label}",
+                type=sensor_type,
+                value=value,
+                unit=unit,
+                path=None,
+                chip=chip,
+                label=label
+            ))
+        return sensors
+
+    def _parse_sensors_json(self, stdout: str) -> List[Sensor]:
+        """Parse `sensors -j` output into Sensor objects"""
+        data = json.loads(stdout)
+        sensors = []
+
+        for chip, readings in data.items():
+            for label, fields in readings.items():
+                if not isinstance(fields, dict):
+                    continue  # e.g. an "Adapter" string entry
+
+                for key, value in fields.items():
+                    if not (key.endswith('_input') or key.endswith('_average')):
+                        continue
+
+                    prefix = key.split('_', 1)[0].rstrip('0123456789')
+                    mapped = _JSON_SENSOR_TYPES.get(prefix)
+                    if mapped is None:
+                        continue
+
+                    sensor_type, unit = mapped
+                    sensors.append(Sensor(
+                        name=f"{chip}/{label}",
+                        type=sensor_type,
+                        value=float(value),
+                        unit=unit,
+                        path=None,
+                        chip=chip,
+                        label=label
+                    ))
+                    break  # One reading per labelled feature
+
+        return sensors
+
     def _parse_sensor_line(self, label: str, value_str: str, chip: str) -> Optional[Sensor]:
-        """Parse a sensor line from lm-sensors output"""
+        """Parse a sensor line from lm-sensors output.
+
+        The cheap unit-character checks pick which precompiled pattern to
+        run, so at most one regex executes for a typical line.
+        """
+        sensor_type = None
+
         # Temperature
-        if '°C' in value_str or 'C' in value_str:
-            match = re.search(r'([+-]?\d+\.?\d*)\s*°?C', value_str)
+        if 'C' in value_str:
+            match = _TEMP_RE.search(value_str)
             if match:
-                return Sensor(
-                    name=f"{chip}/{label}",
-                    type=SensorType.TEMPERATURE,
-                    value=float(match.group(1)),
-                    unit="°C",
-                    path=None,
-                    chip=chip,
-                    label=label
-                )
+                sensor_type, unit = SensorType.TEMPERATURE, "°C"
 
         # Fan (RPM)
-        if 'RPM' in value_str or 'rpm' in value_str:
-            match = re.search(r'(\d+)\s*RPM', value_str, re.IGNORECASE)
+        if sensor_type is None and ('RPM' in value_str or 'rpm' in value_str):
+            match = _FAN_RE.search(value_str)
             if match:
-                return Sensor(
-                    name=f"{chip}/{label}",
-                    type=SensorType.FAN,
-                    value=float(match.group(1)),
-                    unit="RPM",
-                    path=None,
-                    chip=chip,
-                    label=label
-                )
+                sensor_type, unit = SensorType.FAN, "RPM"
 
         # Voltage
-        if 'V' in value_str and '°' not in value_str:
-            match = re.search(r'([+-]?\d+\.?\d*)\s*V', value_str)
+        if sensor_type is None and 'V' in value_str and '°' not in value_str:
+            match = _VOLT_RE.search(value_str)
             if match:
-                return Sensor(
-                    name=f"{chip}/{label}",
-                    type=SensorType.VOLTAGE,
-                    value=float(match.group(1)),
-                    unit="V",
-                    path=None,
-                    chip=chip,
-                    label=label
-                )
+                sensor_type, unit = SensorType.VOLTAGE, "V"
 
         # Power
-        if 'W' in value_str:
-            match = re.search(r'(\d+\.?\d*)\s*W', value_str)
+        if sensor_type is None and 'W' in value_str:
+            match = _POWER_RE.search(value_str)
             if match:
-                return Sensor(
-                    name=f"{chip}/{label}",
-                    type=SensorType.POWER,
-                    value=float(match.group(1)),
-                    unit="W",
-                    path=None,
-                    chip=chip,
-                    label=label
-                )
-
-        return None
-
-    def _detect_sysfs_hwmon(self):
-        """Detect sensors via sysfs hwmon"""
-        hwmon_base = Path("/sys/class/hwmon")
-        if not hwmon_base.exists():
-            return
+                sensor_type, unit = SensorType.POWER, "W"
+
+        if sensor_type is None:
+            return None
+
+        return Sensor(
+            name=f"{chip}/{label}",
+            type=sensor_type,
+            value=float(match.group(1)),
+            unit=unit,
+            path=None,
+            chip=chip,
+            label=label
+        )
+
+    def _detect_sysfs_hwmon(self) -> List[Sensor]:
+        """Detect sensors via sysfs hwmon.
+
+        A single os.scandir pass per chip directory classifies every
+        entry; the previous four Path.glob patterns each re-read the
+        directory, and label lookup re-stat()ed per sensor. Labels are
+        collected into a dict in the same pass.
+        """
+        sensors = []
+        try:
+            hwmon_dirs = [entry.path for entry in os.scandir("/sys/class/hwmon")
+                          if entry.name.startswith("hwmon")]
+        except FileNotFoundError:
+            return sensors
 
-        for hwmon_dir in hwmon_base.glob("hwmon*"):
-            chip_name = "unknown"
+        for hwmon_path in sorted(hwmon_dirs):
+            value_files = []   # (entry name, full path)
+            labels = {}        # feature ("temp1") -> label file path
+            has_name = False
 
-            # Get chip name
-            name_file = hwmon_dir / "name"
-            if name_file.exists():
-                chip_name = name_file.read_text().strip()
+            try:
+                with os.scandir(hwmon_path) as it:
+                    for entry in it:
+                        fname = entry.name
+                        if fname == "name":
+                            has_name = True
+                        elif fname.endswith("_label"):
+                            labels[fname[:-6]] = entry.path
+                        elif fname.endswith("_input") and fname.startswith(("temp", "fan", "in")):
+                            value_files.append((fname, entry.path))
+                        elif fname.endswith("_average") and fname.startswith("power"):
+                            value_files.append((fname, entry.path))
+            except OSError:
+                continue
 
-            # Temperature sensors
-            for temp_file in hwmon_dir.glob("temp*_input"):
+            chip_name = "unknown"
+            if has_name:
                 try:
-                    label = temp_file.stem.replace("_input", "")
-                    label_file = hwmon_dir / f"{temp_file.stem.replace('_input', '_label')}"
-
-                    if label_file.exists():
-                        label = label_file.read_text().strip()
-
-                    temp_milli = int(temp_file.read_text().strip())
-                    temp_celsius = temp_milli / 1000.0
-
-                    self.sensors.append(Sensor(
-                        name=f"{chip_name}/{label}",
-                        type=SensorType.TEMPERATURE,
-                        value=temp_celsius,
-                        unit="°C",
-                        path=str(temp_file),
-                        chip=chip_name,
-                        label=label
-                    ))
-                except Exception:
+                    chip_name = _read_small(os.path.join(hwmon_path, "name")).decode().strip()
+                except OSError:
                     pass
 
-            # Fan sensors
-            for fan_file in hwmon_dir.glob("fan*_input"):
-                try:
-                    label = fan_file.stem.replace("_input", "")
-                    label_file = hwmon_dir / f"{fan_file.stem.replace('_input', '_label')}"
-
-                    if label_file.exists():
-                        label = label_file.read_text().strip()
-
-                    rpm = int(fan_file.read_text().strip())
-
-                    self.sensors.append(Sensor(
-                        name=f"{chip_name}/{label}",
-                        type=SensorType.FAN,
-                        value=float(rpm),
-                        unit="RPM",
-                        path=str(fan_file),
-                        chip=chip_name,
-                        label=label
-                    ))
-                except Exception:
-                    pass
-
-            # Voltage sensors
-            for in_file in hwmon_dir.glob("in*_input"):
-                try:
-                    label = in_file.stem.replace("_input", "")
-                    label_file = hwmon_dir / f"{in_file.stem.replace('_input', '_label')}"
-
-                    if label_file.exists():
-                        label = label_file.read_text().strip()
-
-                    voltage_mv = int(in_file.read_text().strip())
-                    voltage = voltage_mv / 1000.0
+            for fname, fpath in sorted(value_files):
+                feature = fname.rsplit('_', 1)[0]       # e.g. "temp1"
+                prefix = feature.rstrip('0123456789')   # e.g. "temp"
+                spec = _HWMON_FEATURES.get(prefix)
+                if spec is None:
+                    continue
+                sensor_type, unit, scale = spec
 
-                    self.sensors.append(Sensor(
-                        name=f"{chip_name}/{label}",
-                        type=SensorType.VOLTAGE,
-                        value=voltage,
-                        unit="V",
-                        path=str(in_file),
-                        chip=chip_name,
-                        label=label
-                    ))
-                except Exception:
-                    pass
+                label = feature
+                label_path = labels.get(feature)
+                if label_path is not None:
+                    try:
+                        label = _read_small(label_path).decode().strip()
+                    except OSError:
+                        pass
 
-            # Power sensors
-            for power_file in hwmon_dir.glob("power*_average"):
                 try:
-                    label = power_file.stem.replace("_average", "")
-                    label_file = hwmon_dir / f"{label}_label"
-
-                    if label_file.exists():
-                        label = label_file.read_text().strip()
-
-                    power_micro = int(power_file.read_text().strip())
-                    power = power_micro / 1000000.0
-
-                    self.sensors.append(Sensor(
-                        name=f"{chip_name}/{label}",
-                        type=SensorType.POWER,
-                        value=power,
-                        unit="W",
-                        path=str(power_file),
-                        chip=chip_name,
-                        label=label
-                    ))
-                except Exception:
-                    pass
+                    raw = int(_read_small(fpath))
+                except (OSError, ValueError):
+                    continue
 
-    def _detect_thermal_zones(self):
+                sensors.append(Sensor(
+                    name=f"{chip_name}/{label}",
+                    type=sensor_type,
+                    value=raw * scale,
+                    unit=unit,
+                    path=fpath,
+                    chip=chip_name,
+                    label=label,
+                    scale=scale,
+                    # Voltage rails are quasi-static; temps/fans are not
+                    poll_class=(PollClass.SLOW if sensor_type == SensorType.VOLTAGE
+                                else PollClass.FAST)
+                ))
+
+        return sensors
+
+    def _detect_thermal_zones(self) -> List[Sensor]:
         """Detect thermal zones"""
+        sensors = []
         thermal_base = Path("/sys/class/thermal")
         if not thermal_base.exists():
-            return
+            return sensors
 
         for zone_dir in thermal_base.glob("thermal_zone*"):
             try:
-                zone_name = zone_dir.name
+                zone_path = str(zone_dir)
 
-                # Get zone type (label)
-                type_file = zone_dir / "type"
-                label = type_file.read_text().strip() if type_file.exists() else zone_name
+                # Get zone type (label); EAFP - just try the read
+                try:
+                    label = _read_small(zone_path + "/type").decode().strip()
+                except OSError:
+                    label = zone_dir.name
 
                 # Get temperature
-                temp_file = zone_dir / "temp"
-                if temp_file.exists():
-                    temp_milli = int(temp_file.read_text().strip())
-                    temp_celsius = temp_milli / 1000.0
-
-                    self.sensors.append(Sensor(
-                        name=f"thermal/{label}",
-                        type=SensorType.TEMPERATURE,
-                        value=temp_celsius,
-                        unit="°C",
-                        path=str(temp_file),
-                        chip="thermal_zone",
-                        label=label
-                    ))
+                try:
+                    temp_milli = int(_read_small(zone_path + "/temp"))
+                except (OSError, ValueError):
+                    continue
+
+                sensors.append(Sensor(
+                    name=f"thermal/{label}",
+                    type=SensorType.TEMPERATURE,
+                    value=temp_milli * 0.001,
+                    unit="°C",
+                    path=zone_path + "/temp",
+                    chip="thermal_zone",
+                    label=label,
+                    scale=0.001
+                ))
             except Exception:
                 pass
 
-    def _detect_acpi_sensors(self):
+        return sensors
+
+    def _detect_acpi_sensors(self) -> List[Sensor]:
         """Detect ACPI sensors (battery, AC adapter)"""
+        sensors = []
         power_base = Path("/sys/class/power_supply")
         if not power_base.exists():
-            return
+            return sensors
 
         for supply_dir in power_base.iterdir():
             try:
                 supply_name = supply_dir.name
 
-                # Battery voltage
-                voltage_file = supply_dir / "voltage_now"
-                if voltage_file.exists():
-                    voltage_micro = int(voltage_file.read_text().strip())
-                    voltage = voltage_micro / 1000000.0
+                supply_path = str(supply_dir)
+
+                # EAFP: attempt each attribute read; absence is normal
+                # (AC adapters have no battery fields and vice versa)
 
-                    self.sensors.append(Sensor(
+                # Battery voltage
+                try:
+                    voltage_micro = int(_read_small(supply_path + "/voltage_now"))
+                except (OSError, ValueError):
+                    pass
+                else:
+                    sensors.append(Sensor(
                         name=f"power/{supply_name}/voltage",
                         type=SensorType.VOLTAGE,
-                        value=voltage,
+                        value=voltage_micro * 0.000001,
                         unit="V",
-                        path=str(voltage_file),
+                        path=supply_path + "/voltage_now",
                         chip="acpi",
-                        label=f"{supply_name} voltage"
+                        label=f"{supply_name} voltage",
+                        scale=0.000001,
+                        poll_class=PollClass.SLOW
                     ))
 
                 # Battery current
-                current_file = supply_dir / "current_now"
-                if current_file.exists():
-                    current_micro = int(current_file.read_text().strip())
-                    current = current_micro / 1000000.0
-
-                    self.sensors.append(Sensor(
+                try:
+                    current_micro = int(_read_small(supply_path + "/current_now"))
+                except (OSError, ValueError):
+                    pass
+                else:
+                    sensors.append(Sensor(
                         name=f"power/{supply_name}/current",
                         type=SensorType.CURRENT,
-                        value=current,
+                        value=current_micro * 0.000001,
                         unit="A",
-                        path=str(current_file),
+                        path=supply_path + "/current_now",
                         chip="acpi",
-                        label=f"{supply_name} current"
+                        label=f"{supply_name} current",
+                        scale=0.000001,
+                        poll_class=PollClass.SLOW
                     ))
 
                 # Battery power
-                power_file = supply_dir / "power_now"
-                if power_file.exists():
-                    power_micro = int(power_file.read_text().strip())
-                    power = power_micro / 1000000.0
-
-                    self.sensors.append(Sensor(
+                try:
+                    power_micro = int(_read_small(supply_path + "/power_now"))
+                except (OSError, ValueError):
+                    pass
+                else:
+                    sensors.append(Sensor(
                         name=f"power/{supply_name}/power",
                         type=SensorType.POWER,
-                        value=power,
+                        value=power_micro * 0.000001,
                         unit="W",
-                        path=str(power_file),
+                        path=supply_path + "/power_now",
                         chip="acpi",
-                        label=f"{supply_name} power"
+                        label=f"{supply_name} power",
+                        scale=0.000001,
+                        poll_class=PollClass.SLOW
                     ))
 
                 # Battery energy
-                energy_file = supply_dir / "energy_now"
-                if energy_file.exists():
-                    energy_micro = int(energy_file.read_text().strip())
-                    energy = energy_micro / 1000000.0
-
-                    self.sensors.append(Sensor(
+                try:
+                    energy_micro = int(_read_small(supply_path + "/energy_now"))
+                except (OSError, ValueError):
+                    pass
+                else:
+                    sensors.append(Sensor(
                         name=f"power/{supply_name}/energy",
                         type=SensorType.ENERGY,
-                        value=energy,
+                        value=energy_micro * 0.000001,
                         unit="Wh",
-                        path=str(energy_file),
+                        path=supply_path + "/energy_now",
                         chip="acpi",
-                        label=f"{supply_name} energy"
+                        label=f"{supply_name} energy",
+                        scale=0.000001,
+                        poll_class=PollClass.SLOW
                     ))
 
             except Exception:
                 pass
 
-    def _deduplicate_sensors(self):
-        """Remove duplicate sensors"""
-        seen = set()
-        unique_sensors = []
+        return sensors
+
+    def refresh_all(self, slow: bool = True):
+        """Re-read every path-backed sensor in place.
+
+        Detection only populates values once; pollers call this at the
+        top of each tick to get fresh readings over the cached
+        descriptors. With liburing available all reads go out as one
+        io_uring submission (one syscall transition for N sensors);
+        otherwise it falls back to one pread per sensor.
 
-        for sensor in self.sensors:
-            # Create unique key
-            key = (sensor.chip, sensor.label, sensor.type)
-            if key not in seen:
-                seen.add(key)
-                unique_sensors.append(sensor)
+        Pass slow=False to skip SLOW-class sensors (battery energy,
+        voltage rails) on ticks where only the fast movers matter;
+        skipped sensors keep their last reading.
+        """
+        sensors = [s for s in self.sensors
+                   if s.path is not None
+                   and (slow or s.poll_class is PollClass.FAST)]
 
-        self.sensors = unique_sensors
+        if liburing is not None and len(sensors) > 1:
+            try:
+                self._refresh_uring(sensors)
+                return
+            except Exception:
+                pass  # Kernel/binding too old - use the pread loop
+
+        for sensor in sensors:
+            sensor.refresh()
+
+    @staticmethod
+    def _refresh_uring(sensors: List[Sensor]):
+        """Batch-refresh sensors through a single io_uring submission"""
+        ring = liburing.io_uring()
+        liburing.io_uring_queue_init(len(sensors), ring, 0)
+        try:
+            pending = {}
+            for i, sensor in enumerate(sensors):
+                if sensor.fd is None:
+                    try:
+                        sensor.fd = os.open(sensor.path, os.O_RDONLY)
+                    except OSError:
+                        continue
+                buf = bytearray(32)
+                iov = liburing.iovec(buf)
+                sqe = liburing.io_uring_get_sqe(ring)
+                liburing.io_uring_prep_readv(sqe, sensor.fd, iov, 0)
+                sqe.user_data = i
+                pending[i] = (sensor, buf, iov)
+
+            liburing.io_uring_submit(ring)
+
+            cqe = liburing.io_uring_cqe()
+            for _ in range(len(pending)):
+                liburing.io_uring_wait_cqe(ring, cqe)
+                sensor, buf, _ = pending[cqe.user_data]
+                if cqe.res > 0:
+                    try:
+                        sensor.value = int(buf[:cqe.res]) * sensor.scale
+                    except ValueError:
+                        pass
+                else:
+                    sensor.close()
+                liburing.io_uring_cqe_seen(ring, cqe)
+        finally:
+            liburing.io_uring_queue_exit(ring)
+
+    def close(self):
+        """Close every sensor's cached descriptor"""
+        for sensor in getattr(self, 'sensors', []):
+            sensor.close()
+
+    def __del__(self):
+        self.close()
 
     def get_sensors_by_type(self, sensor_type: SensorType) -> List[Sensor]:
         """Get all sensors of a specific type"""
-        return [s for s in self.sensors if s.type == sensor_type]
+        return self.by_type.get(sensor_type, [])
 
     def get_temperature_sensors(self) -> List[Sensor]:
         """Get all temperature sensors"""
@@ -422,20 +702,13 @@ class UniversalSensorDetector:
         lines.append(f"📊 Total Sensors Detected: {len(self.sensors)}")
         lines.append("")
 
-        # Group by type
+        # Group by type; only types with sensors exist in the index
         for sensor_type in SensorType:
-            sensors = self.get_sensors_by_type(sensor_type)
+            sensors = self.by_type.get(sensor_type)
             if not sensors:
                 continue
 
-            icon = {
-                SensorType.TEMPERATURE: "🌡️",
-                SensorType.FAN: "💨",
-                SensorType.VOLTAGE: "⚡",
-                SensorType.POWER: "🔌",
-                SensorType.CURRENT: "⚡",
-                SensorType.ENERGY: "🔋",
-            }.get(sensor_type, "📊")
+            icon = _TYPE_ICONS.get(sensor_type, "📊")
 
             lines.append(f"{icon}  {sensor_type.value.upper()} SENSORS ({len(sensors)})")
             lines.append("-" * 70)
@@ -5,17 +5,27 @@ Real-time monitoring of all system sensors, GPU, fans
 Professional monitoring daemon with alerts and auto-adjustment
 """
 
+import atexit
 import os
+import re
 import sys
 import time
 import signal
 import json
+from collections import deque
 from pathlib import Path
 from typing import Dict, List, Optional
 from dataclasses import dataclass, asdict
 from datetime import datetime
+from functools import cached_property
 from threading import Thread, Event
 
+try:
+    # Optional: C-native JSON with direct dataclass serialization
+    import orjson
+except ImportError:
+    orjson = None
+
 # Add parent directories to path
 service_dir = Path(__file__).resolve().parent
 sys.path.insert(0, str(service_dir.parent))
@@ -27,9 +37,23 @@ from hardware.hardware_detector import HardwareDetector
 from config.power_config import PowerConfig
 
 
-@dataclass
+# Sensor-role classifiers, compiled once at import. Case-insensitive
+# patterns replace the per-sensor .lower() + any(substring) scans; one
+# C-level search per sensor, no intermediate strings or lists.
+_CPU_CHIP_RE = re.compile(r'coretemp|k10temp|cpu', re.IGNORECASE)
+_CPU_TEMP_LABEL_RE = re.compile(r'package|tctl', re.IGNORECASE)
+_CPU_FAN_LABEL_RE = re.compile(r'cpu|fan1', re.IGNORECASE)
+_CPU_POWER_LABEL_RE = re.compile(r'package|cpu', re.IGNORECASE)
+
+
+@dataclass(slots=True, frozen=True)
 class MonitoringSnapshot:
-    """Single monitoring snapshot"""
+    """Single monitoring snapshot.
+
+    Snapshots accumulate in history at one per tick, so slots=True
+    keeps them compact; they're read-only after collection, hence
+    frozen=True.
+    """
     timestamp: str
     cpu_temp: Optional[float]
     gpu_temp: Optional[float]
@@ -52,22 +76,21 @@ class MonitoringService:
         self.interval = interval
         self.log_dir = Path(log_dir)
         self.log_file = self.log_dir / "power_monitoring.log"
-        self.json_log = self.log_dir / "power_monitoring.json"
-
-        # Initialize detectors
-        self.hw_detector = HardwareDetector()
-        self.sensor_detector = UniversalSensorDetector()
-        self.gpu_monitor = UniversalGPUMonitor()
-        self.fan_controller = UniversalFanController()
+        self.json_log = self.log_dir / "power_monitoring.jsonl"
+        self._json_log_writes = 0
 
-        # Configuration
-        self.config = PowerConfig()
-        self.config.set_thermal_config(self.hw_detector.cpu_info.thermal_max_safe)
+        # One handle for the service's lifetime; opening per message
+        # cost open+close+path resolution several times per tick.
+        # Line buffering keeps each message visible as soon as written.
+        try:
+            self._log_fp = open(self.log_file, 'a', buffering=1)
+        except Exception:
+            self._log_fp = None
+        atexit.register(self._close_log)
 
-        # Thermal thresholds
-        self.cpu_temp_warning = self.config.thermal.warning_temp
-        self.cpu_temp_critical = self.config.thermal.critical_temp
-        self.cpu_temp_emergency = self.config.thermal.emergency_temp
+        # Detectors and config are cached_property lazies below:
+        # each costs sysfs scans and/or subprocess calls, so one-shot
+        # callers (status query, tests) only pay for what they touch
 
         # GPU thresholds (typically higher than CPU)
         self.gpu_temp_warning = 75
@@ -77,8 +100,10 @@ class MonitoringService:
         # State
         self.running = False
         self.stop_event = Event()
-        self.snapshots = []
         self.max_snapshots = 100  # Keep last 100 snapshots in memory
+        # Bounded deque evicts the oldest snapshot in O(1); list.pop(0)
+        # shifted the whole history every tick once it filled up
+        self.snapshots = deque(maxlen=self.max_snapshots)
 
         # Auto fan control
         self.auto_fan_control = True
@@ -89,36 +114,125 @@ class MonitoringService:
             'max': 100      # emergency
         }
 
+    @cached_property
+    def hw_detector(self) -> HardwareDetector:
+        return HardwareDetector()
+
+    @cached_property
+    def sensor_detector(self) -> UniversalSensorDetector:
+        detector = UniversalSensorDetector()
+        # Pre-set the cache slot so _resolve_roles (which reads
+        # self.sensor_detector) doesn't recurse into this property
+        self.__dict__['sensor_detector'] = detector
+        self._resolve_roles()
+        return detector
+
+    @cached_property
+    def gpu_monitor(self) -> UniversalGPUMonitor:
+        return UniversalGPUMonitor()
+
+    @cached_property
+    def fan_controller(self) -> UniversalFanController:
+        return UniversalFanController()
+
+    @cached_property
+    def config(self) -> PowerConfig:
+        config = PowerConfig()
+        config.set_thermal_config(self.hw_detector.cpu_info.thermal_max_safe)
+        return config
+
+    # Thermal thresholds, forwarded from config so merely importing or
+    # constructing the service doesn't trigger hardware detection
+    @property
+    def cpu_temp_warning(self) -> int:
+        return self.config.thermal.warning_temp
+
+    @property
+    def cpu_temp_critical(self) -> int:
+        return self.config.thermal.critical_temp
+
+    @property
+    def cpu_temp_emergency(self) -> int:
+        return self.config.thermal.emergency_temp
+
+    def _resolve_roles(self):
+        """Pick the CPU temp/fan/power and voltage sensors once.
+
+        collect_snapshot runs every tick; the chip/label classification
+        only needs to happen when the sensor population changes, so the
+        linear scans and lowercasing live here instead of the hot path.
+        """
+        detector = self.sensor_detector
+
+        # CPU temperature (usually coretemp or k10temp)
+        self._cpu_temp_sensor = None
+        temp_sensors = detector.get_temperature_sensors()
+        for sensor in temp_sensors:
+            if _CPU_CHIP_RE.search(sensor.chip) and _CPU_TEMP_LABEL_RE.search(sensor.label):
+                self._cpu_temp_sensor = sensor
+                break
+
+        # Fallback to first temp sensor
+        if self._cpu_temp_sensor is None and temp_sensors:
+            self._cpu_temp_sensor = temp_sensors[0]
+
+        # CPU fan
+        self._cpu_fan_sensor = None
+        fan_sensors = detector.get_fan_sensors()
+        for sensor in fan_sensors:
+            if _CPU_FAN_LABEL_RE.search(sensor.label):
+                self._cpu_fan_sensor = sensor
+                break
+
+        # Fallback to first fan
+        if self._cpu_fan_sensor is None and fan_sensors:
+            self._cpu_fan_sensor = fan_sensors[0]
+
+        # Voltages (limit to first 5)
+        self._voltage_sensors = detector.get_sensors_by_type(SensorType.VOLTAGE)[:5]
+
+        # CPU package power
+        self._cpu_power_sensor = None
+        for sensor in detector.get_sensors_by_type(SensorType.POWER):
+            if _CPU_POWER_LABEL_RE.search(sensor.label):
+                self._cpu_power_sensor = sensor
+                break
+
     def log(self, message: str):
         """Log message to file and stdout"""
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         log_msg = f"[{timestamp}] {message}"
         print(log_msg)
 
-        try:
-            with open(self.log_file, 'a') as f:
-                f.write(log_msg + "\n")
-        except Exception:
-            pass
+        if self._log_fp is not None:
+            try:
+                self._log_fp.write(log_msg + "\n")
+            except Exception:
+                pass
+
+    def _close_log(self):
+        """Close the persistent log handle (idempotent)"""
+        fp, self._log_fp = self._log_fp, None
+        if fp is not None:
+            try:
+                fp.close()
+            except Exception:
+                pass
+
+    def collect_snapshot(self, refresh_slow: bool = True) -> MonitoringSnapshot:
+        """Collect single monitoring snapshot.
 
-    def collect_snapshot(self) -> MonitoringSnapshot:
-        """Collect single monitoring snapshot"""
+        refresh_slow=False skips re-reading quasi-static sensors
+        (battery energy, voltage rails); their last values carry over.
+        """
         alerts = []
 
-        # Get CPU temperature
-        cpu_temp = None
-        temp_sensors = self.sensor_detector.get_temperature_sensors()
-        if temp_sensors:
-            # Find CPU temp (usually coretemp or k10temp)
-            for sensor in temp_sensors:
-                if any(x in sensor.chip.lower() for x in ['coretemp', 'k10temp', 'cpu']):
-                    if 'package' in sensor.label.lower() or 'tctl' in sensor.label.lower():
-                        cpu_temp = sensor.value
-                        break
-
-            # Fallback to first temp sensor
-            if cpu_temp is None and temp_sensors:
-                cpu_temp = temp_sensors[0].value
+        # Sensor values are only populated at detection; re-read them
+        # over the cached descriptors so this snapshot is current
+        self.sensor_detector.refresh_all(slow=refresh_slow)
+
+        # Get CPU temperature (role resolved once at init)
+        cpu_temp = self._cpu_temp_sensor.value if self._cpu_temp_sensor else None
 
         # Check CPU temp alerts
         if cpu_temp:
@@ -150,33 +264,16 @@ class MonitoringService:
                 elif gpu_temp >= self.gpu_temp_warning:
                     alerts.append(f"⚡ GPU WARNING: {gpu_temp}°C")
 
-        # Get fan speeds
+        # Get fan speed
         cpu_fan_rpm = None
-        fan_sensors = self.sensor_detector.get_fan_sensors()
-        if fan_sensors:
-            # Find CPU fan
-            for sensor in fan_sensors:
-                if 'cpu' in sensor.label.lower() or 'fan1' in sensor.label.lower():
-                    cpu_fan_rpm = int(sensor.value) if sensor.value else None
-                    break
-
-            # Fallback to first fan
-            if cpu_fan_rpm is None and fan_sensors:
-                cpu_fan_rpm = int(fan_sensors[0].value) if fan_sensors[0].value else None
+        if self._cpu_fan_sensor and self._cpu_fan_sensor.value:
+            cpu_fan_rpm = int(self._cpu_fan_sensor.value)
 
         # Get voltages
-        voltages = {}
-        voltage_sensors = self.sensor_detector.get_sensors_by_type(SensorType.VOLTAGE)
-        for sensor in voltage_sensors[:5]:  # Limit to first 5
-            voltages[sensor.label] = sensor.value
+        voltages = {sensor.label: sensor.value for sensor in self._voltage_sensors}
 
         # Get CPU power if available
-        cpu_power = None
-        power_sensors = self.sensor_detector.get_sensors_by_type(SensorType.POWER)
-        for sensor in power_sensors:
-            if 'package' in sensor.label.lower() or 'cpu' in sensor.label.lower():
-                cpu_power = sensor.value
-                break
+        cpu_power = self._cpu_power_sensor.value if self._cpu_power_sensor else None
 
         return MonitoringSnapshot(
             timestamp=datetime.now().isoformat(),
@@ -224,25 +321,33 @@ class MonitoringService:
             except Exception as e:
                 self.log(f"Fan control error: {e}")
 
-    def save_snapshot_to_json(self, snapshot: MonitoringSnapshot):
-        """Save snapshot to JSON log"""
-        try:
-            # Load existing data
-            data = []
-            if self.json_log.exists():
-                with open(self.json_log, 'r') as f:
-                    data = json.load(f)
+    # Rotate the JSONL log after this many records (previous file kept as .1)
+    JSON_LOG_ROTATE_EVERY = 1000
 
-            # Append new snapshot
-            data.append(asdict(snapshot))
+    # Re-read slow (quasi-static) sensors every Nth tick only
+    SLOW_REFRESH_EVERY = 12
 
-            # Keep only last 1000 snapshots
-            if len(data) > 1000:
-                data = data[-1000:]
-
-            # Save
-            with open(self.json_log, 'w') as f:
-                json.dump(data, f, indent=2)
+    def save_snapshot_to_json(self, snapshot: MonitoringSnapshot):
+        """Append snapshot to the JSONL log (one record per line).
+
+        Appending is O(1) per tick; the old array format re-read,
+        re-parsed and rewrote the entire file with indent on every
+        snapshot, costing disk bandwidth proportional to history size.
+        With orjson installed the snapshot dataclass serializes straight
+        to bytes without the asdict() dict copy.
+        """
+        try:
+            if orjson is not None:
+                line = orjson.dumps(snapshot) + b"\n"
+            else:
+                line = (json.dumps(asdict(snapshot)) + "\n").encode()
+            with open(self.json_log, 'ab') as f:
+                f.write(line)
+
+            self._json_log_writes += 1
+            if self._json_log_writes >= self.JSON_LOG_ROTATE_EVERY:
+                self._json_log_writes = 0
+                self.json_log.replace(Path(str(self.json_log) + ".1"))
 
         except Exception as e:
             self.log(f"JSON log error: {e}")
@@ -255,15 +360,17 @@ class MonitoringService:
         self.log(f"   Interval: {self.interval}s")
         self.log(f"   Auto fan control: {'✅ Enabled' if self.auto_fan_control else '❌ Disabled'}")
 
+        tick_n = 0
         while not self.stop_event.is_set():
             try:
-                # Collect snapshot
-                snapshot = self.collect_snapshot()
+                # Collect snapshot; battery/voltage sensors barely move,
+                # so only re-read them every SLOW_REFRESH_EVERY ticks
+                snapshot = self.collect_snapshot(
+                    refresh_slow=(tick_n % self.SLOW_REFRESH_EVERY == 0))
+                tick_n += 1
 
-                # Store in memory
+                # Store in memory (deque drops the oldest past maxlen)
                 self.snapshots.append(snapshot)
-                if len(self.snapshots) > self.max_snapshots:
-                    self.snapshots.pop(0)
 
                 # Log to JSON
                 self.save_snapshot_to_json(snapshot)
@@ -316,6 +423,7 @@ class MonitoringService:
         self.stop_event.set()
         self.monitor_thread.join(timeout=5)
         self.running = False
+        self._close_log()
 
     def get_current_status(self) -> Optional[MonitoringSnapshot]:
         """Get most recent snapshot"""